@@ -15,18 +15,207 @@
 # END COPYRIGHT
 
 import asyncio
+import hashlib
+import json
+import os
+import re
+import shlex
+import sys
+from argparse import SUPPRESS
 from argparse import ArgumentParser
 from asyncio import Future
+from asyncio import Semaphore
 from asyncio import gather
+from functools import lru_cache
+from logging import Logger
 from logging import basicConfig
+from logging import getLogger
 from os import environ
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
 
+from leaf_common.config.config_filter_chain import ConfigFilterChain
 from neuro_san.internals.authorization.factory.authorizer_factory import AuthorizerFactory
 from neuro_san.internals.authorization.interfaces.authorizer import Authorizer
+from neuro_san.internals.graph.persistence.agent_filetree_mapper import AgentFileTreeMapper
+from neuro_san.internals.graph.persistence.manifest_dict_config_filter import ManifestDictConfigFilter
+from neuro_san.internals.graph.persistence.manifest_key_config_filter import ManifestKeyConfigFilter
+from neuro_san.internals.graph.persistence.raw_manifest_restorer import RawManifestRestorer
 from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
+from neuro_san.internals.graph.persistence.served_manifest_config_filter import ServedManifestConfigFilter
+from pyparsing.exceptions import ParseBaseException
+
+# Number of requests in flight against the authorization server at once,
+# when AGENT_AUTHORIZER_CONCURRENCY does not say otherwise
+DEFAULT_CONCURRENCY: int = 32
+
+# Matches the file name in manifest lines like: include "registries/basic/manifest.hocon"
+INCLUDE_REGEX = re.compile(r'^\s*include\s+"([^"]+)"', re.MULTILINE)
+
+# Destinations of the command line arguments that each line of a batch file gives for itself,
+# and how to name those arguments when they are given on the command line too
+BATCH_LINE_ARGS: Dict[str, str] = {"user": "--user", "network": "--network", "grant": "--grant/--revoke"}
+
+
+class BatchLineArgumentParser(ArgumentParser):
+    """
+    ArgumentParser for a single line of a batch file, which raises a ValueError
+    on bad arguments instead of exiting, so the caller can say which line was bad.
+    """
+
+    def error(self, message: str):
+        """
+        :param message: The message describing what is wrong with the arguments
+        """
+        raise ValueError(message)
+
+
+@lru_cache(maxsize=1)
+def load_manifest_storages() -> Dict[str, Dict[str, Any]]:
+    """
+    Reading and parsing the manifest files is comparatively expensive,
+    so only do it once per process.
+
+    :return: the storages restored from the manifest file(s)
+    """
+    restorer = RegistryManifestRestorer()
+    return restorer.restore()
+
+
+def get_manifest_cache_file() -> Optional[str]:
+    """
+    There is one on-disk cache file of network names for each set of manifest(s)
+    and current directory, so that a changed manifest replaces its cache file
+    rather than leaving the old one behind.
+
+    :return: the path to the cache file for the current manifest(s),
+            or None if the manifest(s) cannot be determined
+    """
+    manifest_files: str = environ.get("AGENT_MANIFEST_FILE")
+    if not manifest_files:
+        return None
+
+    # Includes within manifests are relative to the current directory, so that is part of the key.
+    names: List[str] = [os.getcwd()] + manifest_files.split()
+
+    # Use a stable digest; the built-in hash() of strings differs from process to process.
+    key: str = hashlib.sha256("\n".join(names).encode("utf-8")).hexdigest()[:16]
+    cache_home: str = environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "neuro-san", f"manifest-{key}.json")
+
+
+def get_manifest_stamp() -> str:
+    """
+    The cached network names are only valid for the modification times of the manifest(s),
+    every manifest they include, and the agent network file of every manifest entry along with
+    anything those files include. The agent network files matter because restoring the manifest
+    leaves out any network whose file is missing, fails to parse or fails validation,
+    so fixing, adding or breaking one of those changes which networks there are.
+
+    :return: a digest of the modification times of all the files the network names depend on
+    """
+    stamps: List[str] = []
+
+    # Includes within hocon files are relative to the current directory, as they are for the server.
+    hocon_files: List[str] = []
+    for manifest_file in environ.get("AGENT_MANIFEST_FILE", "").split():
+        hocon_files.append(manifest_file)
+        hocon_files.extend(get_manifest_agent_files(manifest_file))
+
+    seen: Set[str] = set()
+    while hocon_files:
+        hocon_file: str = hocon_files.pop(0)
+        if hocon_file in seen:
+            continue
+        seen.add(hocon_file)
+
+        try:
+            stamps.append(f"{hocon_file}:{os.stat(hocon_file).st_mtime_ns}")
+            with open(hocon_file, "r", encoding="utf-8") as hocon_text:
+                hocon_files.extend(INCLUDE_REGEX.findall(hocon_text.read()))
+        except OSError:
+            # A missing file is still part of the stamp by way of its name.
+            # If it shows up later, the stamp changes.
+            stamps.append(f"{hocon_file}:missing")
+
+    return hashlib.sha256("\n".join(stamps).encode("utf-8")).hexdigest()
+
+
+def get_manifest_agent_files(manifest_file: str) -> List[str]:
+    """
+    :param manifest_file: the path to one manifest file
+    :return: the paths to the agent network files for the served entries in the manifest file
+            (including those from the manifests it includes), mapped the same way
+            the manifest restorer maps them. An empty list if the manifest cannot be read.
+    """
+    try:
+        raw_manifest: Dict[str, Any] = RawManifestRestorer().restore(file_reference=manifest_file)
+    except (OSError, ParseBaseException):
+        # The stamp of the manifest file itself covers this until it is fixed.
+        return []
+
+    # Filter the entries like the manifest restorer does, without warning about those not served
+    # as restoring the manifest already does that.
+    manifest_filter = ConfigFilterChain()
+    manifest_filter.register(ManifestKeyConfigFilter(manifest_file))
+    manifest_filter.register(ManifestDictConfigFilter(manifest_file))
+    manifest_filter.register(ServedManifestConfigFilter(manifest_file, warn_on_skip=False))
+    served: Dict[str, Any] = manifest_filter.filter_config(raw_manifest)
+
+    # Agent network files are relative to the directory of the manifest file
+    manifest_dir: str = os.path.dirname(os.path.abspath(manifest_file))
+    mapper = AgentFileTreeMapper()
+    return [os.path.join(manifest_dir, mapper.agent_name_to_filepath(key)) for key in served]
+
+
+def load_manifest_network_names() -> List[str]:
+    """
+    Repeated command line runs against an unchanged manifest skip parsing it entirely
+    by reading the network names from an on-disk cache. Any problem with the cache
+    falls back to parsing the manifest.
+
+    :return: the names of the networks in the manifest(s)
+    """
+    cache_file: Optional[str] = None
+    stamp: Optional[str] = None
+    try:
+        cache_file = get_manifest_cache_file()
+        if cache_file is not None:
+            stamp = get_manifest_stamp()
+            with open(cache_file, "r", encoding="utf-8") as cache:
+                entry: Dict[str, Any] = json.load(cache)
+            if entry.get("stamp") == stamp:
+                return entry["networks"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        # Not cached yet (or unreadable). Parse the manifest below.
+        pass
+
+    networks: List[str] = []
+    storages: Dict[str, Dict[str, Any]] = load_manifest_storages()
+
+    storage: Dict[str, Any] = None
+    for storage in storages.values():
+        networks.extend(storage.keys())
+
+    if cache_file is not None and stamp is not None:
+        # Write then rename so a concurrent reader never sees a partial file
+        temp_file: str = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as cache:
+                json.dump({"stamp": stamp, "networks": networks}, cache)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+    return networks
 
 
 class Authorize:
@@ -47,109 +236,345 @@ class Authorize:
         # Make the logging in the lower-level code which is also used in the server show up by
         # default in this manual-use app..
         basicConfig(level="INFO")
+        self._log: Logger = getLogger(__name__)
+
+        # Resolve what we need from the environment once up front
+        # rather than every time authorization is changed.
+        actions: str = environ.get("AGENT_AUTHORIZER_ALLOW_ACTION", "read")
+        self._relations: List[str] = list(dict.fromkeys(actions.split()))
+        self._resource_type: str = environ.get("AGENT_AUTHORIZER_RESOURCE_KEY", "AgentNetwork")
+        self._actor_type: str = environ.get("AGENT_AUTHORIZER_ACTOR_KEY", "User")
+
+        # Bound how many requests are in flight against the authorization server at once
+        # so that large manifests do not flood it with simultaneous connections.
+        self._concurrency: int = self.get_concurrency()
+
+        # (actor id, relation, resource id) triples known to be granted by this process,
+        # so that repeated grants (like from a batch file) do not go back to the server.
+        self._granted: Set[Tuple[str, str, str]] = set()
+
+    def get_concurrency(self) -> int:
+        """
+        :return: the number of requests allowed in flight against the authorization server at once,
+                from the AGENT_AUTHORIZER_CONCURRENCY env var. Anything other than a whole number
+                of at least 1 falls back to the default, as 0 would never let any request through.
+        """
+        value: str = environ.get("AGENT_AUTHORIZER_CONCURRENCY")
+        if value is None:
+            return DEFAULT_CONCURRENCY
+
+        concurrency: int = 0
+        try:
+            concurrency = int(value)
+        except ValueError:
+            pass
+
+        if concurrency < 1:
+            self._log.error(
+                "AGENT_AUTHORIZER_CONCURRENCY must be a whole number of at least 1, not '%s'. Using %d instead.",
+                value,
+                DEFAULT_CONCURRENCY,
+            )
+            return DEFAULT_CONCURRENCY
+
+        return concurrency
 
     def run(self):
         """
         Workhorse outline method.
         """
-        network_names: List[str] = self.get_network_names()
-        user_names: List[str] = self.get_user_names()
+        # Read any batch file before connecting, so that a bad line fails before any request is made.
+        all_args: List[Any] = self.get_all_args()
 
         authorizer: Authorizer = AuthorizerFactory.create_authorizer()
         print(f"Using Authorizer: {authorizer.__class__.__name__}")
 
-        asyncio.run(self.change_authorization(authorizer, network_names, user_names))
+        asyncio.run(self.run_async(authorizer, all_args))
+
+    async def run_async(self, authorizer: Authorizer, all_args: List[Any] = None):
+        """
+        Enters the authorizer's context only once so that its client and connections
+        are reused for everything done in this run, including every line of a batch file.
+        :param authorizer: the authorizer to use
+        :param all_args: the parsed arguments to run with, one after the other in order.
+                    None means get them from get_all_args().
+        """
+        if all_args is None:
+            all_args = self.get_all_args()
+
+        async with authorizer as auth:
+            for args in all_args:
+                await self.apply_authorization(
+                    auth, self.get_network_names(args), self.get_user_names(args), args.grant
+                )
+
+    def get_all_args(self) -> List[Any]:
+        """
+        Each line of the batch file gets its own arguments. Problems with the batch file
+        are reported like any other problem with the command line.
+        :return: a list of parsed arguments to run with, one after the other in order
+        """
+        if not self.args.batch_file:
+            return [self.args]
+
+        all_args: List[Any] = []
+        try:
+            all_args = self.read_batch_file(self.args.batch_file)
+        except (OSError, ValueError) as exception:
+            arg_parser = ArgumentParser()
+            self.add_args(arg_parser)
+            arg_parser.error(str(exception))
+
+        return all_args
 
-    def get_network_names(self) -> List[str]:
+    def read_batch_file(self, batch_file: str) -> List[Any]:
         """
+        Each non-empty line of the batch file takes the same arguments as the command line,
+        for instance:
+            --user "alice bob" --network hello_world --revoke
+        Lines starting with # are comments.
+        :param batch_file: the path to the batch file to read
+        :return: a list of parsed arguments, one per line in the batch file
+        :raises ValueError: naming the line of the batch file with bad arguments
+        :raises OSError: if the batch file cannot be read
+        """
+        # Without help, -h on a line is just another bad argument rather than a reason to exit.
+        arg_parser = BatchLineArgumentParser(add_help=False)
+        self.add_args(arg_parser)
+
+        batch_args: List[Any] = []
+        with open(batch_file, "r", encoding="utf-8") as lines:
+            for line_number, line in enumerate(lines, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    line_args: Any = arg_parser.parse_args(shlex.split(line))
+                    if line_args.batch_file:
+                        raise ValueError("--batch-file cannot be used within a batch file")
+                    batch_args.append(line_args)
+                except ValueError as exception:
+                    raise ValueError(f"{batch_file} line {line_number}: {exception}") from exception
+
+        return batch_args
+
+    def get_network_names(self, args: Any) -> List[str]:
+        """
+        :param args: the parsed arguments from the command line or a line of a batch file
         :return: the names of the networks in the manifest(s)
         """
         networks: List[str] = []
 
-        if self.args.network:
-            networks = self.args.network.split(" ")
+        if args.network:
+            # Splitting on any whitespace avoids empty names from repeated spaces.
+            # Remove any duplicates while preserving order
+            networks = list(dict.fromkeys(args.network.split()))
             return networks
 
-        restorer = RegistryManifestRestorer()
-        storages: Dict[str, Dict[str, Any]] = restorer.restore()
-
-        storage: Dict[str, Any] = None
-        for storage in storages.values():
-            networks.extend(storage.keys())
-
+        networks = load_manifest_network_names()
         return networks
 
-    def get_user_names(self) -> List[str]:
+    def get_user_names(self, args: Any) -> List[str]:
         """
+        :param args: the parsed arguments from the command line or a line of a batch file
         :return: the names of the users to authorize
         """
-        user_names: List[str] = self.args.user.split(" ")
+        # Splitting on any whitespace avoids empty names from repeated spaces.
+        # Remove any duplicates while preserving order
+        user_names: List[str] = list(dict.fromkeys(args.user.split()))
         return user_names
 
-    async def change_authorization(self, authorizer: Authorizer, network_names: List[str], user_names: List[str]):
+    async def change_authorization(
+        self, authorizer: Authorizer, network_names: List[str], user_names: List[str], grant: bool = None
+    ):
         """
         :param authorizer: the authorizer to use
         :param network_names: the names of the networks to authorize
         :param user_names: the names of the users to authorize
+        :param grant: True to grant authorization, False to revoke it.
+                    None means follow the --grant/--revoke command line arguments.
         """
-
-        # Find the action/relations to authorize
-        actions: str = environ.get("AGENT_AUTHORIZER_ALLOW_ACTION", "read")
-        relations: List[str] = actions.split(" ")
-        resource_type: str = environ.get("AGENT_AUTHORIZER_RESOURCE_KEY", "AgentNetwork")
-        actor_type: str = environ.get("AGENT_AUTHORIZER_ACTOR_KEY", "User")
+        if grant is None:
+            grant = self.args.grant
 
         async with authorizer as auth:
-            # Gather everything to do together so as to save on clients
-            coroutines: List[Future] = []
+            await self.apply_authorization(auth, network_names, user_names, grant)
 
-            # Loop through all the networks as resources to authorize for the user(s)
-            for network_name in network_names:
-                resource: Dict[str, Any] = {"type": resource_type, "id": network_name}
+    async def apply_authorization(
+        self, auth: Authorizer, network_names: List[str], user_names: List[str], grant: bool
+    ):
+        """
+        :param auth: the authorizer to use, whose context has already been entered
+        :param network_names: the names of the networks to authorize
+        :param user_names: the names of the users to authorize
+        :param grant: True to grant authorization, False to revoke it
+        """
+        semaphore = Semaphore(self._concurrency)
+        triples: List[Tuple[Dict[str, Any], str, Dict[str, Any]]] = self.collect_triples(
+            network_names, user_names, grant
+        )
+
+        # Gather everything to do together so as to save on clients
+        coroutines: List[Future] = []
+        for actor, relation, resource in triples:
+            coroutines.append(self.authorize_one_bounded(semaphore, auth, actor, relation, resource, grant))
 
-                # Loop through all the users
-                for user_name in user_names:
-                    actor: Dict[str, Any] = {"type": actor_type, "id": user_name}
+        await gather(*coroutines)
 
-                    # Loop through all the relations to grant/revoke
-                    for relation in relations:
-                        coroutines.append(self.authorize_one(auth, actor, relation, resource))
+    def collect_triples(
+        self, network_names: List[str], user_names: List[str], grant: bool
+    ) -> List[Tuple[Dict[str, Any], str, Dict[str, Any]]]:
+        """
+        :param network_names: the names of the networks to authorize
+        :param user_names: the names of the users to authorize
+        :param grant: True to grant authorization, False to revoke it
+        :return: a list of every unique (actor, relation, resource) triple that needs a grant/revoke request
+        """
+        triples: List[Tuple[Dict[str, Any], str, Dict[str, Any]]] = []
+        seen: Set[Tuple[str, str, str]] = set()
+
+        # Loop through all the networks as resources to authorize for the user(s)
+        for network_name in network_names:
+            resource: Dict[str, Any] = {"type": self._resource_type, "id": network_name}
+
+            # Loop through all the users
+            for user_name in user_names:
+                actor: Dict[str, Any] = {"type": self._actor_type, "id": user_name}
+
+                # Loop through all the relations to grant/revoke
+                for relation in self._relations:
+                    key: Tuple[str, str, str] = (user_name, relation, network_name)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                    if grant and key in self._granted:
+                        # Already granted earlier in this run. No need to ask the server again.
+                        self.record_result(actor, relation, resource, grant, False)
+                        continue
+
+                    triples.append((actor, relation, resource))
+
+        return triples
+
+    async def authorize_one_bounded(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        semaphore: Semaphore,
+        authorizer: Authorizer,
+        actor: Dict[str, Any],
+        relation: str,
+        resource: Dict[str, Any],
+        grant: bool,
+    ) -> bool:
+        """
+        Calls authorize_one() only once a slot in the semaphore is available.
 
-            await gather(*coroutines)
+        :param semaphore: the Semaphore limiting the number of concurrent requests
+        :param authorizer: the authorizer to use
+        :param actor: the actor to authorize
+        :param relation: the relation to authorize
+        :param resource: the resource to authorize
+        :param grant: True to grant authorization, False to revoke it
+        :return: True if successful. False otherwise
+        """
+        async with semaphore:
+            return await self.authorize_one(authorizer, actor, relation, resource, grant)
 
-    async def authorize_one(
-        self, authorizer: Authorizer, actor: Dict[str, Any], relation: str, resource: Dict[str, Any]
+    async def authorize_one(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, authorizer: Authorizer, actor: Dict[str, Any], relation: str, resource: Dict[str, Any], grant: bool
     ) -> bool:
         """
         :param authorizer: the authorizer to use
         :param actor: the actor to authorize
         :param relation: the relation to authorize
         :param resource: the resource to authorize
+        :param grant: True to grant authorization, False to revoke it
         :return: True if successful. False otherwise
         """
 
-        message: str = f"{actor['type']}:{actor['id']} {relation} on {resource['type']}:{resource['id']}"
+        # Let the logger do any string formatting only when the message will actually be emitted.
         succeeded: bool = False
-        if self.args.grant:
-            print(f"Attempting to grant {message}")
+        if grant:
+            self._log.debug(
+                "Attempting to grant %s:%s %s on %s:%s",
+                actor["type"],
+                actor["id"],
+                relation,
+                resource["type"],
+                resource["id"],
+            )
             succeeded = await authorizer.grant(actor, relation, resource)
-            success_message: str = "succeeded" if succeeded else "already existed"
-            print(f"Grant for {message} {success_message}")
         else:
-            print(f"Attempting to revoke {message}")
+            self._log.debug(
+                "Attempting to revoke %s:%s %s on %s:%s",
+                actor["type"],
+                actor["id"],
+                relation,
+                resource["type"],
+                resource["id"],
+            )
             succeeded = await authorizer.revoke(actor, relation, resource)
-            success_message: str = "succeeded" if succeeded else "already existed"
-            print(f"Revoke for {message} {success_message}")
 
+        self.record_result(actor, relation, resource, grant, succeeded)
         return succeeded
 
-    def parse_args(self):
+    def record_result(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self, actor: Dict[str, Any], relation: str, resource: Dict[str, Any], grant: bool, succeeded: bool
+    ):
+        """
+        Remembers and reports the result of a single grant/revoke
+        :param actor: the actor that was authorized
+        :param relation: the relation that was authorized
+        :param resource: the resource that was authorized
+        :param grant: True if this was a grant, False if it was a revoke
+        :param succeeded: True if the grant/revoke succeeded
+        """
+        # Whether or not the grant succeeded, the relation exists now. After a revoke it does not.
+        key: Tuple[str, str, str] = (actor["id"], relation, resource["id"])
+        if grant:
+            self._granted.add(key)
+        else:
+            self._granted.discard(key)
+
+        success_message: str = "succeeded" if succeeded else "already existed"
+        operation: str = "Grant" if grant else "Revoke"
+        self._log.info(
+            "%s for %s:%s %s on %s:%s %s",
+            operation,
+            actor["type"],
+            actor["id"],
+            relation,
+            resource["type"],
+            resource["id"],
+            success_message,
+        )
+
+    def parse_args(self, command_line: List[str] = None):
         """
         Parse command line arguments into member variables
+        :param command_line: the arguments to parse. None means those given to this process.
         """
+        if command_line is None:
+            command_line = sys.argv[1:]
+
         arg_parser = ArgumentParser()
         self.add_args(arg_parser)
-        self.args = arg_parser.parse_args()
+        self.args = arg_parser.parse_args(command_line)
+
+        if self.args.batch_file:
+            # Each line of the batch file gives these for itself, so they would be silently ignored here.
+            # Parse again without their defaults so that only those actually given show up,
+            # however argparse was asked for them (abbreviated or not).
+            given_parser = ArgumentParser()
+            self.add_args(given_parser)
+            given_parser.set_defaults(**{dest: SUPPRESS for dest in BATCH_LINE_ARGS})
+            given: Any = given_parser.parse_args(command_line)
+            ignored: List[str] = [name for dest, name in BATCH_LINE_ARGS.items() if getattr(given, dest) != SUPPRESS]
+            if ignored:
+                arg_parser.error(
+                    f"{', '.join(ignored)} cannot be used with --batch-file."
+                    " Give them on the lines of the batch file instead."
+                )
 
     def add_args(self, arg_parser: ArgumentParser):
         """
@@ -199,6 +624,18 @@ This is the default operation.
             action="store_false",
             help="""
 Operation of this run is to revoke authorization for given user(s) and network(s).
+""",
+        )
+        arg_parser.add_argument(
+            "--batch-file",
+            type=str,
+            default=None,
+            dest="batch_file",
+            help="""
+Optional path to a file where each line takes the same --user, --network, --grant and --revoke
+arguments as this command line. Lines are run in order while reusing a single connection
+to the authorization server. Lines starting with # are ignored.
+None of --user, --network, --grant or --revoke can be given on the command line with this.
 """,
         )
 
@@ -13,15 +13,48 @@
 # limitations under the License.
 #
 # END COPYRIGHT
+import asyncio
+import importlib
 import logging
 import os
+import sys
+import threading
+from functools import lru_cache
+from types import ModuleType
 from typing import Any
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
 # Use lazy loading of types to avoid dependency bloat for stuff most people don't need.
 from leaf_common.config.resolver_util import ResolverUtil
 
+# Environment variable values that are considered True by _get_bool_env()
+_TRUE_TOKENS = frozenset({"1", "true", "yes", "on"})
+
+
+@lru_cache(maxsize=1)
+def _default_config() -> dict:
+    """Read the default Langfuse configuration from environment variables once per process.
+
+    Call _default_config.cache_clear() to force the environment to be re-read.
+
+    Returns:
+        Dictionary with default Langfuse configuration values
+    """
+    return {
+        # Langfuse defaults
+        "langfuse_enabled": os.getenv("LANGFUSE_ENABLED", "false"),
+        "langfuse_use_existing": os.getenv("LANGFUSE_USE_EXISTING", "false"),
+        "langfuse_secret_key": os.getenv("LANGFUSE_SECRET_KEY", ""),
+        "langfuse_public_key": os.getenv("LANGFUSE_PUBLIC_KEY", ""),
+        "langfuse_host": os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com"),
+        "langfuse_project_name": os.getenv("LANGFUSE_PROJECT_NAME", "default"),
+        "langfuse_release": os.getenv("LANGFUSE_RELEASE", "dev"),
+        "langfuse_debug": os.getenv("LANGFUSE_DEBUG", "false"),
+        "langfuse_sample_rate": float(os.getenv("LANGFUSE_SAMPLE_RATE", "1.0")),
+    }
+
 
 class LangfusePlugin:
     """
@@ -34,6 +67,19 @@ class LangfusePlugin:
     - Environment variable management
     """
 
+    # Lazily resolved types, shared across instances so the import machinery is only walked once.
+    _langfuse_class: Optional[Type[Any]] = None
+    _callback_handler_class: Optional[Type[Any]] = None
+    _patched_openai_module: Optional[ModuleType] = None
+
+    # Process-wide initialization state, so that concurrent or repeated calls to initialize()
+    # from different threads or instances do not patch the SDKs or create clients twice.
+    # The PID is tracked because a forked child does not inherit a working client.
+    # The PID and client are kept together as one (pid, client) tuple so that the unlocked
+    # check in _adopt_process_initialization() never sees one without the other.
+    _init_lock: threading.Lock = threading.Lock()
+    _process_state: Optional[Tuple[int, Any]] = None
+
     def __init__(self, config: Optional[dict] = None) -> None:
         """Initialize the LangfusePlugin with the optional configuration.
 
@@ -52,18 +98,8 @@ class LangfusePlugin:
         Returns:
             Dictionary with default Langfuse configuration values
         """
-        return {
-            # Langfuse defaults
-            "langfuse_enabled": os.getenv("LANGFUSE_ENABLED", "false"),
-            "langfuse_use_existing": os.getenv("LANGFUSE_USE_EXISTING", "false"),
-            "langfuse_secret_key": os.getenv("LANGFUSE_SECRET_KEY", ""),
-            "langfuse_public_key": os.getenv("LANGFUSE_PUBLIC_KEY", ""),
-            "langfuse_host": os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com"),
-            "langfuse_project_name": os.getenv("LANGFUSE_PROJECT_NAME", "default"),
-            "langfuse_release": os.getenv("LANGFUSE_RELEASE", "dev"),
-            "langfuse_debug": os.getenv("LANGFUSE_DEBUG", "false"),
-            "langfuse_sample_rate": float(os.getenv("LANGFUSE_SAMPLE_RATE", "1.0")),
-        }
+        # Hand back a copy so callers can modify it without affecting the cached values
+        return dict(_default_config())
 
     @staticmethod
     def _get_bool_env(var_name: str, default: bool) -> bool:
@@ -79,7 +115,7 @@ class LangfusePlugin:
         val = os.getenv(var_name)
         if val is None:
             return default
-        return val.strip().lower() in {"1", "true", "yes", "on"}
+        return val.strip().lower() in _TRUE_TOKENS
 
     def _configure_langfuse_client(self) -> None:
         """Configure Langfuse client with API keys and settings.
@@ -91,11 +127,13 @@ class LangfusePlugin:
         - Debug settings
         """
         # Lazily load Langfuse class
-        langfuse_class: Type[Any] = ResolverUtil.create_type(
-            "langfuse.Langfuse",
-            raise_if_not_found=False,
-            install_if_missing="langfuse",
-        )
+        if LangfusePlugin._langfuse_class is None:
+            LangfusePlugin._langfuse_class = ResolverUtil.create_type(
+                "langfuse.Langfuse",
+                raise_if_not_found=False,
+                install_if_missing="langfuse",
+            )
+        langfuse_class: Type[Any] = LangfusePlugin._langfuse_class
 
         if langfuse_class is None:  # pragma: no cover
             self._logger.warning("Langfuse package not installed")
@@ -113,14 +151,14 @@ class LangfusePlugin:
         debug = self._get_bool_env("LANGFUSE_DEBUG", False)
 
         try:
-            self.langfuse_client = langfuse_class(
+            self.langfuse_client = langfuse_class(  # pylint: disable=not-callable
                 secret_key=secret_key,
                 public_key=public_key,
                 host=host,
                 release=release,
                 debug=debug,
             )
-            self._logger.info("Langfuse client configured successfully")
+            self._logger.debug("Langfuse client configured")
 
             # Patch OpenAI module globally to use Langfuse's instrumented version
             self._patch_openai_module()
@@ -128,32 +166,34 @@ class LangfusePlugin:
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self._logger.error("Failed to configure Langfuse client: %s", exc)
 
-    @staticmethod
-    def _patch_openai_module() -> None:
+    def _patch_openai_module(self) -> None:
         """Patch the openai module with Langfuse's instrumented version.
 
         This replaces the global openai module so that all OpenAI calls
         are automatically traced by Langfuse.
         """
         try:
-            import importlib  # pylint: disable=import-outside-toplevel
-            import sys  # pylint: disable=import-outside-toplevel
-
-            # Import langfuse.openai module (not a class, so we use importlib)
-            langfuse_openai_module = importlib.import_module("langfuse.openai")
-
-            # The module contains an 'openai' attribute which is the patched openai module
-            if hasattr(langfuse_openai_module, "openai"):
-                # Replace the openai module with Langfuse's version
-                sys.modules["openai"] = langfuse_openai_module.openai
-                print("[Langfuse] OpenAI module globally patched for automatic tracing")
-            else:
-                print("[Langfuse] Warning: langfuse.openai module structure unexpected")
+            # Only walk the import machinery the first time through
+            patched_openai: ModuleType = LangfusePlugin._patched_openai_module
+            if patched_openai is None:
+                # Import langfuse.openai module (not a class, so we use importlib)
+                langfuse_openai_module = importlib.import_module("langfuse.openai")
+
+                # The module contains an 'openai' attribute which is the patched openai module
+                if not hasattr(langfuse_openai_module, "openai"):
+                    self._logger.warning("langfuse.openai module structure unexpected")
+                    return
+                patched_openai = langfuse_openai_module.openai
+                LangfusePlugin._patched_openai_module = patched_openai
+
+            # Replace the openai module with Langfuse's version, unless that has already been done
+            if sys.modules.get("openai") is not patched_openai:
+                sys.modules["openai"] = patched_openai
+                self._logger.debug("OpenAI module globally patched for automatic tracing")
         except Exception as exc:  # pylint: disable=broad-exception-caught
-            print(f"[Langfuse] Failed to patch OpenAI module: {exc}")
+            self._logger.warning("Failed to patch OpenAI module: %s", exc)
 
-    @staticmethod
-    def _instrument_sdks() -> None:
+    def _instrument_sdks(self) -> None:
         """Instrument various AI/ML SDKs for tracing.
 
         Note: Langfuse uses a different instrumentation approach than Phoenix.
@@ -164,10 +204,10 @@ class LangfusePlugin:
         The OpenAI module patching is done in _patch_openai_module() which is called
         from _configure_langfuse_client() to ensure it happens after the client is set up.
         """
-        print("[Langfuse] SDK instrumentation ready")
-        print("[Langfuse] - OpenAI calls will be automatically traced")
-        print("[Langfuse] - Use get_callback_handler() for LangChain integration")
-        print("[Langfuse] - Use @observe decorator for custom function tracing")
+        self._logger.debug(
+            "SDK instrumentation ready: OpenAI calls are traced automatically,"
+            " use get_callback_handler() for LangChain and @observe for custom functions"
+        )
 
     def _try_langfuse_setup(self) -> bool:
         """Try setting up Langfuse with automatic instrumentation.
@@ -200,40 +240,70 @@ class LangfusePlugin:
 
         This method is idempotent and safe to call multiple times.
         """
-        print(f"[Langfuse] initialize called, PID={os.getpid()}")
-        print(f"[Langfuse] _initialized={self._initialized}")
-        print(f"[Langfuse] LANGFUSE_ENABLED={os.getenv('LANGFUSE_ENABLED')}")
-        print(f"[Langfuse] LANGFUSE_USE_EXISTING={os.getenv('LANGFUSE_USE_EXISTING')}")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "initialize called, PID=%d, _initialized=%s, LANGFUSE_ENABLED=%s, LANGFUSE_USE_EXISTING=%s",
+                os.getpid(),
+                self._initialized,
+                os.getenv("LANGFUSE_ENABLED"),
+                os.getenv("LANGFUSE_USE_EXISTING"),
+            )
 
         if self._initialized:
-            print(f"[Langfuse] Already initialized in this process, skipping (PID={os.getpid()})")
+            self._logger.debug("Already initialized in this process, skipping")
             return
 
-        if not self._get_bool_env("LANGFUSE_ENABLED", False):
-            print(f"[Langfuse] Langfuse not enabled, skipping (PID={os.getpid()})")
+        # Cheap check without the lock for the common already-initialized case
+        if self._adopt_process_initialization():
             return
 
-        # If using existing Langfuse instance, just verify keys are set
-        if self._get_bool_env("LANGFUSE_USE_EXISTING", False):
-            print(f"[Langfuse] Using existing Langfuse instance (PID={os.getpid()})")
-            print(f"[Langfuse] Keys configured, skipping initialization (PID={os.getpid()})")
-            self._initialized = True
-            return
+        with LangfusePlugin._init_lock:
+            # Another thread may have finished initializing while we waited for the lock
+            if self._adopt_process_initialization():
+                return
 
-        try:
-            print(f"[Langfuse] Attempting Langfuse setup (PID={os.getpid()})")
-            setup_successful = self._try_langfuse_setup()
-            if setup_successful:
-                print(f"[Langfuse] Setup succeeded (PID={os.getpid()})")
-                print(f"[Langfuse] Traces will be sent to: {os.getenv('LANGFUSE_HOST', 'https://cloud.langfuse.com')}")
-                print(f"[Langfuse] Project: {os.getenv('LANGFUSE_PROJECT_NAME', 'default')}")
+            if not self._get_bool_env("LANGFUSE_ENABLED", False):
+                self._logger.debug("Langfuse not enabled, skipping")
+                return
+
+            # If using existing Langfuse instance, just verify keys are set
+            if self._get_bool_env("LANGFUSE_USE_EXISTING", False):
+                self._logger.debug("Using existing Langfuse instance, skipping initialization")
                 self._initialized = True
-            else:
-                print(f"[Langfuse] Setup failed (PID={os.getpid()})")
-            print(f"[Langfuse] Initialization complete (PID={os.getpid()})")
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            print(f"[Langfuse] Initialization FAILED: {exc} (PID={os.getpid()})")
-            self._logger.warning("Langfuse initialization failed: %s", exc)
+                LangfusePlugin._process_state = (os.getpid(), None)
+                return
+
+            try:
+                setup_successful = self._try_langfuse_setup()
+                if setup_successful:
+                    self._logger.info(
+                        "Langfuse initialized (PID=%d), sending traces for project %s to %s",
+                        os.getpid(),
+                        os.getenv("LANGFUSE_PROJECT_NAME", "default"),
+                        os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com"),
+                    )
+                    self._initialized = True
+                    LangfusePlugin._process_state = (os.getpid(), self.langfuse_client)
+                else:
+                    self._logger.warning("Langfuse setup failed")
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self._logger.warning("Langfuse initialization failed: %s", exc)
+
+    def _adopt_process_initialization(self) -> bool:
+        """Share the Langfuse setup already done in this process, if any.
+
+        Returns:
+            True if Langfuse was already initialized in this process, False otherwise
+        """
+        # Read the shared state only once, as another thread may release it at any time
+        process_pid, process_client = LangfusePlugin._process_state or (None, None)
+        if process_pid != os.getpid():
+            return False
+
+        self._logger.debug("Already initialized in this process, skipping")
+        self.langfuse_client = process_client
+        self._initialized = True
+        return True
 
     @property
     def is_initialized(self) -> bool:
@@ -247,68 +317,114 @@ class LangfusePlugin:
     def set_environment_variables(self) -> None:
         """Set Langfuse environment variables."""
         # Langfuse configuration
-        os.environ["LANGFUSE_ENABLED"] = str(self.config.get("langfuse_enabled", "false")).lower()
-        os.environ["LANGFUSE_USE_EXISTING"] = str(self.config.get("langfuse_use_existing", "false")).lower()
-        os.environ["LANGFUSE_HOST"] = self.config.get("langfuse_host", "https://cloud.langfuse.com")
-        os.environ["LANGFUSE_PROJECT_NAME"] = str(self.config.get("langfuse_project_name", "default"))
-        os.environ["LANGFUSE_RELEASE"] = self.config.get("langfuse_release", "dev")
-        os.environ["LANGFUSE_DEBUG"] = str(self.config.get("langfuse_debug", "false")).lower()
-        os.environ["LANGFUSE_SAMPLE_RATE"] = str(self.config.get("langfuse_sample_rate", "1.0"))
+        candidates = {
+            "LANGFUSE_ENABLED": str(self.config.get("langfuse_enabled", "false")).lower(),
+            "LANGFUSE_USE_EXISTING": str(self.config.get("langfuse_use_existing", "false")).lower(),
+            "LANGFUSE_HOST": self.config.get("langfuse_host", "https://cloud.langfuse.com"),
+            "LANGFUSE_PROJECT_NAME": str(self.config.get("langfuse_project_name", "default")),
+            "LANGFUSE_RELEASE": self.config.get("langfuse_release", "dev"),
+            "LANGFUSE_DEBUG": str(self.config.get("langfuse_debug", "false")).lower(),
+            "LANGFUSE_SAMPLE_RATE": str(self.config.get("langfuse_sample_rate", "1.0")),
+        }
 
         # Only set keys if provided (don't overwrite existing values with empty strings)
         if self.config.get("langfuse_secret_key"):
-            os.environ["LANGFUSE_SECRET_KEY"] = self.config.get("langfuse_secret_key", "")
+            candidates["LANGFUSE_SECRET_KEY"] = self.config.get("langfuse_secret_key", "")
         if self.config.get("langfuse_public_key"):
-            os.environ["LANGFUSE_PUBLIC_KEY"] = self.config.get("langfuse_public_key", "")
+            candidates["LANGFUSE_PUBLIC_KEY"] = self.config.get("langfuse_public_key", "")
 
-        print(f"LANGFUSE_ENABLED set to: {os.environ['LANGFUSE_ENABLED']}")
-        print(f"LANGFUSE_USE_EXISTING set to: {os.environ['LANGFUSE_USE_EXISTING']}")
-        print(f"LANGFUSE_HOST set to: {os.environ['LANGFUSE_HOST']}")
-        print(f"LANGFUSE_PROJECT_NAME set to: {os.environ['LANGFUSE_PROJECT_NAME']}")
-        print(f"LANGFUSE_RELEASE set to: {os.environ['LANGFUSE_RELEASE']}")
-        print(f"LANGFUSE_DEBUG set to: {os.environ['LANGFUSE_DEBUG']}")
-        print(f"LANGFUSE_SAMPLE_RATE set to: {os.environ['LANGFUSE_SAMPLE_RATE']}\n")
+        # Each write to os.environ calls putenv(), so skip any values that are already set.
+        updates = {key: value for key, value in candidates.items() if os.environ.get(key) != value}
+        os.environ.update(updates)
+
+        # Never log the key values themselves
+        self._logger.info("Langfuse env set: %s", list(updates))
 
     def get_callback_handler(self):
         """Get Langfuse callback handler for LangChain integration.
 
         Returns:
-            Langfuse CallbackHandler instance if available, None otherwise
+            A new Langfuse CallbackHandler instance for each call if available, None otherwise
         """
         if not self._initialized or self.langfuse_client is None:
             return None
 
+        # Only the resolved type is cached. The handler keeps per-run state, like the runs
+        # it is tracking and the current trace, so each call gets a new one that is never
+        # shared between concurrent LangChain invocations.
         try:
             # Lazily load CallbackHandler
-            callback_handler_class: Type[Any] = ResolverUtil.create_type(
-                "langfuse.callback.CallbackHandler",
-                raise_if_not_found=False,
-                install_if_missing="langfuse",
-            )
-
-            if callback_handler_class is not None:
-                return callback_handler_class()
-            return None
+            if LangfusePlugin._callback_handler_class is None:
+                LangfusePlugin._callback_handler_class = ResolverUtil.create_type(
+                    "langfuse.callback.CallbackHandler",
+                    raise_if_not_found=False,
+                    install_if_missing="langfuse",
+                )
+            callback_handler_class: Type[Any] = LangfusePlugin._callback_handler_class
+
+            if callback_handler_class is None:
+                return None
+            return callback_handler_class()  # pylint: disable=not-callable
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self._logger.warning("Failed to create Langfuse callback handler: %s", exc)
             return None
 
     def flush(self) -> None:
-        """Flush any pending traces to Langfuse."""
+        """Flush any pending traces to Langfuse.
+
+        This blocks while buffered traces are posted over HTTP.
+        Callers running inside an event loop should use aflush() instead.
+        """
         if self.langfuse_client is not None:
             try:
                 self.langfuse_client.flush()
-                print("[Langfuse] Flushed pending traces")
+                self._logger.debug("Flushed pending traces")
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 self._logger.warning("Failed to flush Langfuse traces: %s", exc)
 
+    async def aflush(self) -> None:
+        """Flush any pending traces to Langfuse without blocking the event loop."""
+        if self.langfuse_client is not None:
+            await asyncio.to_thread(self.flush)
+
     def shutdown(self) -> None:
-        """Shutdown Langfuse client and flush remaining traces."""
+        """Shutdown Langfuse client and flush remaining traces.
+
+        This blocks until the remaining traces have been flushed.
+        Callers running inside an event loop should await ashutdown() instead.
+        """
         if self.langfuse_client is not None:
-            print("[Langfuse] Shutting down...")
+            self._logger.info("Shutting down Langfuse")
             try:
                 self.langfuse_client.flush()
-                self._initialized = False
-                print("[Langfuse] Shutdown complete")
+                self._release_process_client()
+                self._logger.info("Langfuse shutdown complete")
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 self._logger.warning("Failed to shutdown Langfuse cleanly: %s", exc)
+
+    async def ashutdown(self, timeout: float = 5.0) -> None:
+        """Shutdown Langfuse client and flush remaining traces without blocking the event loop.
+
+        Args:
+            timeout: Maximum number of seconds to wait for pending traces to be flushed
+        """
+        if self.langfuse_client is None:
+            return
+
+        self._logger.info("Shutting down Langfuse")
+        try:
+            await asyncio.wait_for(self.aflush(), timeout=timeout)
+            self._logger.info("Langfuse shutdown complete")
+        except asyncio.TimeoutError:
+            self._logger.warning("Timed out after %s seconds flushing Langfuse traces", timeout)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._logger.warning("Failed to shutdown Langfuse cleanly: %s", exc)
+        self._release_process_client()
+
+    def _release_process_client(self) -> None:
+        """Mark this plugin as no longer initialized and forget the process-wide client if it is ours."""
+        self._initialized = False
+        with LangfusePlugin._init_lock:
+            _, process_client = LangfusePlugin._process_state or (None, None)
+            if process_client is self.langfuse_client:
+                LangfusePlugin._process_state = None
@@ -0,0 +1,64 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+
+from typing import List
+
+import pytest
+
+from tests.utils.hocon_cache import set_hocon_cache_dir
+
+
+def pytest_addoption(parser: pytest.Parser):
+    """
+    Command line options for the tests. These are added here rather than in the
+    conftest.py files further down so that pytest knows about them at startup.
+    """
+    parser.addoption(
+        "--skip-unchanged-hocons",
+        action="store_true",
+        default=False,
+        help="Skip hocon integration test cases that passed last time and whose files have not changed since."
+        " Meant for local iterations only. Changes to coded tools or LLM behavior are not detected.",
+    )
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Also run tests marked with @pytest.mark.slow, which are skipped by default.",
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    """
+    Keep parsed hocon files in a directory under pytest's own cache, wherever that is configured to be.
+    """
+    cache: pytest.Cache = getattr(config, "cache", None)
+    if cache is not None:
+        set_hocon_cache_dir(str(cache.mkdir("hocon")))
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]):
+    """
+    Skip the tests marked with @pytest.mark.slow unless --run-slow was given.
+    """
+    if config.getoption("run_slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="Slow test. Use --run-slow to run it.")
+    for item in items:
+        if item.get_closest_marker("slow") is not None:
+            item.add_marker(skip_slow)
@@ -0,0 +1,90 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Generator
+from typing import Set
+
+import pytest
+from neuro_san.test.driver import data_driven_agent_test_driver
+
+from tests.utils.cached_dynamic_hocon_unit_tests import CachedDynamicHoconUnitTests
+from tests.utils.hocon_pass_cache import HoconPassCache
+from tests.utils.shared_agent_session_factory import SharedAgentSessionFactory
+
+# Names of the fail-fast groups in which some test case has already failed.
+# Each group is all the parameterized cases of one test function.
+# This state lives in a single process. When running with pytest-xdist, a failure
+# only skips the remaining cases of its group on the same worker, unless the group
+# is pinned to one worker with an xdist_group marker.
+FAILED_FAIL_FAST_GROUPS = pytest.StashKey[Set[str]]()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_agent_session_factory():
+    """
+    Have every data-driven test case in the session create its agent sessions
+    through one SharedAgentSessionFactory, so the manifest and its agent networks
+    are read in once instead of once per test case.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(data_driven_agent_test_driver, "AgentSessionFactory", SharedAgentSessionFactory)
+        yield SharedAgentSessionFactory
+    SharedAgentSessionFactory.reset()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def skip_unchanged_hocons(request: pytest.FixtureRequest):
+    """
+    With --skip-unchanged-hocons, skip any hocon test case that passed last time
+    and whose files have not changed since. Off by default, so CI always runs everything.
+    """
+    if request.config.getoption("skip_unchanged_hocons"):
+        CachedDynamicHoconUnitTests.set_pass_cache(HoconPassCache(request.config.cache))
+    yield
+    CachedDynamicHoconUnitTests.set_pass_cache(None)
+
+
+def get_fail_fast_group(item: pytest.Item) -> str:
+    """
+    :param item: A test item
+    :return: The name of the fail-fast group for the item if it is marked with
+            @pytest.mark.fail_fast, otherwise None
+    """
+    if item.get_closest_marker("fail_fast") is None:
+        return None
+    # The node id of the test function itself, without any parameterization
+    return item.nodeid.split("[", 1)[0]
+
+
+def pytest_runtest_setup(item: pytest.Item):
+    """
+    Skip a fail-fast test case when an earlier case in its group has already failed.
+    """
+    group: str = get_fail_fast_group(item)
+    if group is not None and group in item.config.stash.get(FAILED_FAIL_FAST_GROUPS, set()):
+        pytest.skip(f"Earlier case failed for fail-fast group '{group}'")
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item: pytest.Item) -> Generator[None, pytest.TestReport, pytest.TestReport]:
+    """
+    Remember when a fail-fast test case fails, so the rest of its group can be skipped.
+    """
+    report: pytest.TestReport = yield
+    group: str = get_fail_fast_group(item)
+    if group is not None and report.failed:
+        item.config.stash.setdefault(FAILED_FAIL_FAST_GROUPS, set()).add(group)
+    return report
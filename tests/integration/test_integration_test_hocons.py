@@ -21,224 +21,186 @@
 # You can run this test by doing the following:
 # https://github.dev/cognizant-ai-lab/neuro-san-studio/blob/355_add_smoke_test_using_music_pro_hocon/CONTRIBUTING.md#testing-guidelines
 
+import os
+from typing import Any
+from typing import Dict
+from typing import List
 from unittest import TestCase
 
 import pytest
 from neuro_san.test.unittest.dynamic_hocon_unit_tests import DynamicHoconUnitTests
-from parameterized import parameterized
-
-from tests.utils.fail_fast_param_mixin import FailFastParamMixin
-
-
-class TestIntegrationTestHocons(TestCase, FailFastParamMixin):
-    """
-    Data-driven dynamic test cases where each test case is specified by a single hocon file.
-    """
-
-    # A single instance of the DynamicHoconUnitTests helper class.
-    # We pass it our source file location and a relative path to the common
-    # root of the test hocon files listed in the @parameterized.expand()
-    # annotation below so the instance can find the hocon test cases listed.
-    DYNAMIC = DynamicHoconUnitTests(__file__, path_to_basis="../fixtures")
-
-    @parameterized.expand(
-        DynamicHoconUnitTests.from_hocon_list(
-            [
-                # These can be in any order.
-                # Ideally more basic functionality will come first.
-                # Barring that, try to stick to alphabetical order.
-                "basic/music_nerd_pro/combination_responses_with_history_direct.hocon",
-                "basic/pii_middleware/jenny_phone.hocon",
-                # List more hocon files as they become available here.
-            ]
-        ),
-        skip_on_empty=True,
-    )
-    @pytest.mark.integration
-    @pytest.mark.integration_basic
-    def test_hocon_basic(self, test_name: str, test_hocon: str):
-        """
-        Test method for a single parameterized test case specified by a hocon file.
-        Arguments to this method are given by the iteration that happens as a result
-        of the magic of the @parameterized.expand annotation above.
-
-        :param test_name: The name of a single test.
-        :param test_hocon: The hocon file of a single data-driven test case.
-        """
-        # Call the guts of the dynamic test driver.
-        # This will expand the test_hocon file name from the expanded list to
-        # include the file basis implied by the __file__ and path_to_basis above.
-
-        self.DYNAMIC.one_test_hocon(self, test_name, test_hocon)
-
-    @parameterized.expand(
-        DynamicHoconUnitTests.from_hocon_list(
-            [
-                # These can be in any order.
-                # Ideally more basic functionality will come first.
-                # Barring that, try to stick to alphabetical order.
-                "basic/coffee_finder_advanced/coffee_what_time_sly_data_1am.hocon",
-                "basic/coffee_finder_advanced/coffee_where_sly_data_1am.hocon",
-                "basic/coffee_finder_advanced/coffee_where_sly_data_6am.hocon",
-                "basic/coffee_finder_advanced/coffee_where_sly_data_8am.hocon",
-                # List more hocon files as they become available here.
-            ]
-        ),
-        skip_on_empty=True,
-    )
-    @pytest.mark.integration
-    @pytest.mark.integration_basic
-    @pytest.mark.integration_basic_coffee_finder_advanced
-    def test_hocon_industry_coffee_finder_advanced(self, test_name: str, test_hocon: str):
-        """
-        Test method for a single parameterized test case specified by a hocon file.
-        Arguments to this method are given by the iteration that happens as a result
-        of the magic of the @parameterized.expand annotation above.
-
-        :param test_name: The name of a single test.
-        :param test_hocon: The hocon file of a single data-driven test case.
-        """
-        # Call the guts of the dynamic test driver.
-        # This will expand the test_hocon file name from the expanded list to
-        # include the file basis implied by the __file__ and path_to_basis above.
-        self.DYNAMIC.one_test_hocon(self, test_name, test_hocon)
-
-    # ------------------------------------------------------------
-    # FAIL-FAST GROUP KEY (base test method name)
-    # ------------------------------------------------------------
-    @parameterized.expand(
-        DynamicHoconUnitTests.from_hocon_list(
-            [
-                # These can be in any order.
-                # Ideally more basic functionality will come first.
-                # Barring that, try to stick to alphabetical order.
-                "basic/coffee_finder_advanced/coffee_continue_0_order_sly_data_1am_negative_test.hocon",
-                "basic/coffee_finder_advanced/coffee_continue_1_order_sly_data_1am.hocon",
-                "basic/coffee_finder_advanced/coffee_continue_2_reorder_sly_data_1am.hocon",
-                "basic/coffee_finder_advanced/coffee_continue_3_reorder_sly_data_8am_new_location.hocon",
-                "basic/coffee_finder_advanced/coffee_continue_4_reorder_sly_data_8am_from_last_order.hocon",
-                "basic/coffee_finder_advanced/coffee_continue_5_reorder_sly_data_8am_from_1st_order.hocon",
-                "basic/coffee_finder_advanced/"
-                "coffee_continue_reorder_sly_data_8am_negative_test_multi_orders_exist.hocon",
-                "basic/coffee_finder_advanced/coffee_continue_reorder_sly_data_1am_negative_test_partial_name.hocon",
-                # List more hocon files as they become available here.
-            ]
-        ),
-        skip_on_empty=True,
-    )
-    @pytest.mark.integration
-    @pytest.mark.integration_basic
-    @pytest.mark.integration_basic_coffee_finder_advanced
-    @pytest.mark.integration_basic_coffee_finder_advanced_e2e
-    def test_hocon_industry_coffee_finder_advanced_e2e(self, test_name: str, test_hocon: str):
-        self.run_hocon_group_fail_fast_case(test_name, test_hocon)
-
-    @parameterized.expand(
-        DynamicHoconUnitTests.from_hocon_list(
-            [
-                # These can be in any order.
-                # Ideally more basic functionality will come first.
-                # Barring that, try to stick to alphabetical order.
-                "industry/telco_network_support_test.hocon",
-                "industry/consumer_decision_assistant_comprehensive.hocon",
-                "industry/cpg_agents_test.hocon",
-                # List more hocon files as they become available here.
-            ]
-        ),
-        skip_on_empty=True,
-    )
-    @pytest.mark.integration
-    @pytest.mark.integration_industry
-    def test_hocon_industry(self, test_name: str, test_hocon: str):
-        """
-        Test method for a single parameterized test case specified by a hocon file.
-        Arguments to this method are given by the iteration that happens as a result
-        of the magic of the @parameterized.expand annotation above.
-
-        :param test_name: The name of a single test.
-        :param test_hocon: The hocon file of a single data-driven test case.
-        """
-        # Call the guts of the dynamic test driver.
-        # This will expand the test_hocon file name from the expanded list to
-        # include the file basis implied by the __file__ and path_to_basis above.
-        self.DYNAMIC.one_test_hocon(self, test_name, test_hocon)
-
-    @parameterized.expand(
-        DynamicHoconUnitTests.from_hocon_list(
-            [
-                # These can be in any order.
-                # Ideally more basic functionality will come first.
-                # Barring that, try to stick to alphabetical order.
-                "industry/airline_policy/basic_eco_carryon_baggage.hocon",
-                "industry/airline_policy/basic_eco_checkin_baggage_at_gate_fee.hocon",
-                "industry/airline_policy/basic_eco_checkin_baggage.hocon",
-                "industry/airline_policy/general_baggage_tracker.hocon",
-                "industry/airline_policy/general_carryon_baggage_liquid_items.hocon",
-                "industry/airline_policy/general_carryon_baggage_overweight_fee.hocon",
-                "industry/airline_policy/general_carryon_person_item_size.hocon",
-                "industry/airline_policy/general_carryon_other_items.hocon",
-                "industry/airline_policy/general_carryon_baggage_size.hocon",
-                "industry/airline_policy/general_carryon_person_item.hocon",
-                "industry/airline_policy/general_checkin_baggage_liquid_items.hocon",
-                "industry/airline_policy/general_checkin_baggage.hocon",
-                "industry/airline_policy/general_child_car_seat.hocon",
-                "industry/airline_policy/general_child_stroller.hocon",
-                "industry/airline_policy/general_children_formula.hocon",
-                "industry/airline_policy/general_children_id_domestic_flights.hocon",
-                "industry/airline_policy/general_children_id_international_flights.hocon",
-                "industry/airline_policy/general_children_seating.hocon",
-                "industry/airline_policy/general_family_with_children.hocon",
-                "industry/airline_policy/premier_gold_checkin_baggage_weights.hocon",
-                "industry/airline_policy/premium_eco_checkin_baggage_weights.hocon",
-                # List more hocon files as they become available here.
-            ]
-        ),
-        skip_on_empty=True,
-    )
-    @pytest.mark.integration
-    @pytest.mark.integration_industry
-    @pytest.mark.integration_industry_airline_policy
-    def test_hocon_industry_airline_policy(self, test_name: str, test_hocon: str):
-        """
-        Test method for a single parameterized test case specified by a hocon file.
-        Arguments to this method are given by the iteration that happens as a result
-        of the magic of the @parameterized.expand annotation above.
-
-        :param test_name: The name of a single test.
-        :param test_hocon: The hocon file of a single data-driven test case.
-        """
-        # Call the guts of the dynamic test driver.
-        # This will expand the test_hocon file name from the expanded list to
-        # include the file basis implied by the __file__ and path_to_basis above.
-        self.DYNAMIC.one_test_hocon(self, test_name, test_hocon)
-
-    @parameterized.expand(
-        DynamicHoconUnitTests.from_hocon_list(
-            [
-                # These can be in any order.
-                # Ideally more basic functionality will come first.
-                # Barring that, try to stick to alphabetical order.
-                "experimental/copy_cat/copy_hello_world.hocon",
-                "experimental/mdap_decomposer/long_multiplication.hocon",
-                "experimental/mdap_decomposer/list_sorting.hocon",
-                # List more hocon files as they become available here.
-            ]
-        ),
-        skip_on_empty=True,
-    )
-    @pytest.mark.integration
-    @pytest.mark.integration_experimental
-    def test_hocon_experimental(self, test_name: str, test_hocon: str):
-        """
-        Test method for a single parameterized test case specified by a hocon file.
-        Arguments to this method are given by the iteration that happens as a result
-        of the magic of the @parameterized.expand annotation above.
-
-        :param test_name: The name of a single test.
-        :param test_hocon: The hocon file of a single data-driven test case.
-        """
-        # Call the guts of the dynamic test driver.
-        # This will expand the test_hocon file name from the expanded list to
-        # include the file basis implied by the __file__ and path_to_basis above.
-
-        self.DYNAMIC.one_test_hocon(self, test_name, test_hocon)
+
+from tests.utils.cached_dynamic_hocon_unit_tests import CachedDynamicHoconUnitTests
+from tests.utils.hocon_cache import load_hocon
+
+# The hocon test case files for each group of tests below, relative to the fixtures directory.
+# These live in a single manifest file alongside this one, read in once at import time.
+HOCON_GROUPS: Dict[str, List[str]] = load_hocon(os.path.join(os.path.dirname(__file__), "hocon_manifest.hocon"))
+
+
+def hocon_test_params(hocon_files: List[str]) -> List[Any]:
+    """
+    :param hocon_files: The hocon test case files for one group of tests
+    :return: A list of (test_name, test_hocon) parameters for @pytest.mark.parametrize,
+            each identified by the base name of its hocon test case file rather than
+            the whole relative path.
+    """
+    params: List[Any] = []
+    for test_name, test_hocon in DynamicHoconUnitTests.from_hocon_list(hocon_files):
+        base_name: str = os.path.splitext(os.path.basename(test_hocon))[0]
+        params.append(pytest.param(test_name, test_hocon, id=base_name))
+    return params
+
+
+# Expand each group into @pytest.mark.parametrize() entries once at import time
+# rather than once per decorator.
+HOCON_PARAMS: Dict[str, List[Any]] = {
+    name: hocon_test_params(hocon_files) for name, hocon_files in HOCON_GROUPS.items()
+}
+
+# A single instance of the DynamicHoconUnitTests helper class.
+# We pass it our source file location and a relative path to the common
+# root of the test hocon files listed in the @pytest.mark.parametrize()
+# annotations below so the instance can find the hocon test cases listed.
+# The cached flavor only parses any given hocon test case file once.
+DYNAMIC = CachedDynamicHoconUnitTests(__file__, path_to_basis="../fixtures")
+
+
+def run_hocon_test(test_name: str, test_hocon: str, use_pass_cache: bool = True):
+    """
+    Run a single data-driven test case specified by a hocon file.
+
+    :param test_name: The name of a single test.
+    :param test_hocon: The hocon file of a single data-driven test case.
+    :param use_pass_cache: False to run the test case even with --skip-unchanged-hocons,
+                because it depends on state left behind by other test cases.
+    """
+    # Call the guts of the dynamic test driver.
+    # This will expand the test_hocon file name from the expanded list to
+    # include the file basis implied by the __file__ and path_to_basis above.
+    # The driver reports its asserts and skips through a plain TestCase,
+    # which pytest understands without running the test as a unittest.
+    DYNAMIC.one_test_hocon(TestCase(), test_name, test_hocon, use_pass_cache=use_pass_cache)
+
+
+@pytest.mark.parametrize("test_name,test_hocon", HOCON_PARAMS["basic"])
+@pytest.mark.integration
+@pytest.mark.integration_basic
+def test_hocon_basic(test_name: str, test_hocon: str):
+    """
+    Test function for a single parameterized test case specified by a hocon file.
+
+    :param test_name: The name of a single test.
+    :param test_hocon: The hocon file of a single data-driven test case.
+    """
+    run_hocon_test(test_name, test_hocon)
+
+
+@pytest.mark.parametrize("test_name,test_hocon", HOCON_PARAMS["coffee_finder_advanced"])
+@pytest.mark.integration
+@pytest.mark.integration_basic
+@pytest.mark.integration_basic_coffee_finder_advanced
+# Every coffee_finder_advanced case shares the agent's ./TopicMemory.json with the e2e cases below,
+# so under "pytest -n <workers> --dist loadgroup" keep them all on a single worker.
+@pytest.mark.xdist_group(name="coffee_finder_advanced")
+def test_hocon_industry_coffee_finder_advanced(test_name: str, test_hocon: str):
+    """
+    Test function for a single parameterized test case specified by a hocon file.
+
+    :param test_name: The name of a single test.
+    :param test_hocon: The hocon file of a single data-driven test case.
+    """
+    run_hocon_test(test_name, test_hocon)
+
+
+@pytest.mark.parametrize("test_name,test_hocon", HOCON_PARAMS["coffee_finder_advanced_e2e"])
+@pytest.mark.integration
+@pytest.mark.integration_basic
+@pytest.mark.integration_basic_coffee_finder_advanced
+@pytest.mark.integration_basic_coffee_finder_advanced_e2e
+@pytest.mark.fail_fast
+# The e2e cases build on one another through the agent's ./TopicMemory.json, so under
+# "pytest -n <workers> --dist loadgroup" keep them on the same single worker as the other
+# coffee_finder_advanced cases, in order. Every other group is independent
+# and is left unmarked so its cases spread freely across the workers.
+@pytest.mark.xdist_group(name="coffee_finder_advanced")
+# test_hocon_industry_coffee_finder_advanced_e2e_sequence below covers the same cases
+# in a single test, so these only run with --run-slow, for debugging individual steps.
+@pytest.mark.slow
+def test_hocon_industry_coffee_finder_advanced_e2e(test_name: str, test_hocon: str):
+    """
+    Test function for a single parameterized test case specified by a hocon file.
+    Once any case fails, the rest of the cases for this function are skipped.
+
+    :param test_name: The name of a single test.
+    :param test_hocon: The hocon file of a single data-driven test case.
+    """
+    # Each case depends on the ones before it, so never skip one on its own as unchanged.
+    run_hocon_test(test_name, test_hocon, use_pass_cache=False)
+
+
+@pytest.mark.integration
+@pytest.mark.integration_basic
+@pytest.mark.integration_basic_coffee_finder_advanced
+@pytest.mark.integration_basic_coffee_finder_advanced_e2e
+@pytest.mark.xdist_group(name="coffee_finder_advanced")
+def test_hocon_industry_coffee_finder_advanced_e2e_sequence(request: pytest.FixtureRequest):
+    """
+    Test function that runs all of the coffee_finder_advanced e2e test cases in order,
+    stopping at the first one that fails.
+
+    :param request: The pytest request for this test
+    """
+    if request.config.getoption("run_slow"):
+        # The slow tests above run these same cases one by one. Running the chain twice would
+        # start the second run from the ./TopicMemory.json state left behind by the first.
+        pytest.skip("The slow e2e tests run these cases one by one with --run-slow")
+
+    # The cases build on one another, so with --skip-unchanged-hocons they are
+    # only ever skipped or run all together.
+    expansions: List[List[str]] = DynamicHoconUnitTests.from_hocon_list(HOCON_GROUPS["coffee_finder_advanced_e2e"])
+    DYNAMIC.one_test_hocon_sequence(TestCase(), expansions)
+
+
+@pytest.mark.parametrize("test_name,test_hocon", HOCON_PARAMS["industry"])
+@pytest.mark.integration
+@pytest.mark.integration_industry
+@pytest.mark.fail_fast
+def test_hocon_industry(test_name: str, test_hocon: str):
+    """
+    Test function for a single parameterized test case specified by a hocon file.
+    Once any case fails, the rest of the cases for this function are skipped.
+
+    :param test_name: The name of a single test.
+    :param test_hocon: The hocon file of a single data-driven test case.
+    """
+    run_hocon_test(test_name, test_hocon)
+
+
+@pytest.mark.parametrize("test_name,test_hocon", HOCON_PARAMS["industry_airline_policy"])
+@pytest.mark.integration
+@pytest.mark.integration_industry
+@pytest.mark.integration_industry_airline_policy
+@pytest.mark.fail_fast
+def test_hocon_industry_airline_policy(test_name: str, test_hocon: str):
+    """
+    Test function for a single parameterized test case specified by a hocon file.
+    Once any case fails, the rest of the cases for this function are skipped.
+
+    :param test_name: The name of a single test.
+    :param test_hocon: The hocon file of a single data-driven test case.
+    """
+    run_hocon_test(test_name, test_hocon)
+
+
+@pytest.mark.parametrize("test_name,test_hocon", HOCON_PARAMS["experimental"])
+@pytest.mark.integration
+@pytest.mark.integration_experimental
+def test_hocon_experimental(test_name: str, test_hocon: str):
+    """
+    Test function for a single parameterized test case specified by a hocon file.
+
+    :param test_name: The name of a single test.
+    :param test_hocon: The hocon file of a single data-driven test case.
+    """
+    run_hocon_test(test_name, test_hocon)
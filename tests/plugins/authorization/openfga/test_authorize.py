@@ -0,0 +1,465 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import io
+import os
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+from unittest import TestCase
+from unittest.mock import patch
+
+from plugins.authorization.openfga.authorize import DEFAULT_CONCURRENCY
+from plugins.authorization.openfga.authorize import Authorize
+from plugins.authorization.openfga.authorize import get_manifest_cache_file
+from plugins.authorization.openfga.authorize import load_manifest_network_names
+
+
+class FakeAuthorizer:
+    """
+    Stands in for an Authorizer talking to an authorization server.
+    Remembers every request made of it and how many were in flight at once.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.calls: List[Tuple[str, str, str, str]] = []
+        self.relations: Set[Tuple[str, str, str]] = set()
+        self.entered: int = 0
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+
+    async def __aenter__(self):
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+    async def grant(self, actor: Dict[str, Any], relation: str, resource: Dict[str, Any]) -> bool:
+        """
+        :return: True if the relation was added. False if it already existed.
+        """
+        key: Tuple[str, str, str] = await self.request("grant", actor, relation, resource)
+        if key in self.relations:
+            return False
+        self.relations.add(key)
+        return True
+
+    async def revoke(self, actor: Dict[str, Any], relation: str, resource: Dict[str, Any]) -> bool:
+        """
+        :return: True if the relation was removed. False if it did not exist.
+        """
+        key: Tuple[str, str, str] = await self.request("revoke", actor, relation, resource)
+        if key not in self.relations:
+            return False
+        self.relations.discard(key)
+        return True
+
+    async def request(
+        self, operation: str, actor: Dict[str, Any], relation: str, resource: Dict[str, Any]
+    ) -> Tuple[str, str, str]:
+        """
+        Records a request and yields to the event loop so other requests can overlap with it.
+        :return: The (actor id, relation, resource id) key for the request
+        """
+        self.calls.append((operation, actor["id"], relation, resource["id"]))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return (actor["id"], relation, resource["id"])
+
+
+class TestAuthorize(TestCase):
+    """
+    Unit tests for the Authorize command line tool, run against a FakeAuthorizer.
+    """
+
+    def setUp(self):
+        """
+        Set up a scratch directory for batch files
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def write_batch_file(self, lines: List[str]) -> str:
+        """
+        :param lines: The lines of the batch file
+        :return: The path to the batch file
+        """
+        batch_file: str = os.path.join(self.temp_dir.name, "batch.txt")
+        with open(batch_file, "w", encoding="utf-8") as batch:
+            batch.write("\n".join(lines) + "\n")
+        return batch_file
+
+    def test_read_batch_file(self):
+        """
+        Tests that each line of a batch file is parsed like a command line,
+        skipping blank lines and comments.
+        """
+        batch_file: str = self.write_batch_file(
+            [
+                "# Comment",
+                '--user "alice  bob" --network hello_world',
+                "",
+                "   # Indented comment",
+                "--user carol --network music_nerd --revoke",
+            ]
+        )
+        batch_args: List[Any] = Authorize().read_batch_file(batch_file)
+
+        self.assertEqual(2, len(batch_args))
+        self.assertEqual("alice  bob", batch_args[0].user)
+        self.assertEqual("hello_world", batch_args[0].network)
+        self.assertTrue(batch_args[0].grant)
+        self.assertEqual("carol", batch_args[1].user)
+        self.assertEqual("music_nerd", batch_args[1].network)
+        self.assertFalse(batch_args[1].grant)
+
+    def test_change_authorization_follows_args(self):
+        """
+        Tests that change_authorization() grants or revokes as the command line says
+        when it is not told which to do.
+        """
+        authorize = Authorize()
+        authorize.parse_args(["--user", "alice", "--network", "hello_world", "--revoke"])
+        authorizer = FakeAuthorizer()
+
+        asyncio.run(authorize.change_authorization(authorizer, ["hello_world"], ["alice"]))
+        asyncio.run(authorize.change_authorization(authorizer, ["hello_world"], ["alice"], grant=True))
+
+        expected: List[Tuple[str, str, str, str]] = [
+            ("revoke", "alice", "read", "hello_world"),
+            ("grant", "alice", "read", "hello_world"),
+        ]
+        self.assertEqual(expected, authorizer.calls)
+
+    def test_duplicates_are_requested_once(self):
+        """
+        Tests that repeated users, networks and relations only make one request each.
+        """
+        with patch.dict(os.environ, {"AGENT_AUTHORIZER_ALLOW_ACTION": "read  read"}):
+            authorize = Authorize()
+        authorize.parse_args(["--user", "alice alice", "--network", "hello_world  hello_world music_nerd"])
+        authorizer = FakeAuthorizer()
+
+        asyncio.run(authorize.run_async(authorizer))
+
+        expected: List[Tuple[str, str, str, str]] = [
+            ("grant", "alice", "read", "hello_world"),
+            ("grant", "alice", "read", "music_nerd"),
+        ]
+        self.assertEqual(expected, authorizer.calls)
+
+    def test_concurrency_is_bounded(self):
+        """
+        Tests that no more than AGENT_AUTHORIZER_CONCURRENCY requests are ever in flight at once.
+        """
+        with patch.dict(os.environ, {"AGENT_AUTHORIZER_CONCURRENCY": "3"}):
+            authorize = Authorize()
+        networks: str = " ".join(f"network_{index}" for index in range(10))
+        authorize.parse_args(["--user", "alice", "--network", networks])
+        authorizer = FakeAuthorizer()
+
+        asyncio.run(authorize.run_async(authorizer))
+
+        self.assertEqual(10, len(authorizer.calls))
+        self.assertEqual(3, authorizer.max_in_flight)
+
+    def test_zero_concurrency_uses_default(self):
+        """
+        Tests that a concurrency of 0, which would never let a request through, falls back to the default.
+        """
+        with patch.dict(os.environ, {"AGENT_AUTHORIZER_CONCURRENCY": "0"}):
+            with self.assertLogs("plugins.authorization.openfga.authorize", level="ERROR"):
+                authorize = Authorize()
+                self.assertEqual(DEFAULT_CONCURRENCY, authorize.get_concurrency())
+
+        authorize.parse_args(["--user", "alice", "--network", "hello_world music_nerd"])
+        authorizer = FakeAuthorizer()
+        asyncio.run(asyncio.wait_for(authorize.run_async(authorizer), timeout=5))
+        self.assertEqual(2, len(authorizer.calls))
+
+    def test_non_numeric_concurrency_uses_default(self):
+        """
+        Tests that a concurrency that is not a whole number falls back to the default
+        rather than failing before the arguments are even parsed.
+        """
+        for value in ["lots", "-4", "2.5"]:
+            with patch.dict(os.environ, {"AGENT_AUTHORIZER_CONCURRENCY": value}):
+                with self.assertLogs("plugins.authorization.openfga.authorize", level="ERROR"):
+                    self.assertEqual(DEFAULT_CONCURRENCY, Authorize().get_concurrency(), value)
+
+    def test_batch_file_lines_run_in_order(self):
+        """
+        Tests that each line of a batch file runs with its own arguments,
+        in order and inside a single authorizer context.
+        """
+        batch_file: str = self.write_batch_file(
+            [
+                "--user alice --network hello_world",
+                "--user bob --network music_nerd",
+                "--user alice --network hello_world --revoke",
+            ]
+        )
+        authorize = Authorize()
+        authorize.parse_args(["--batch-file", batch_file])
+        authorizer = FakeAuthorizer()
+
+        asyncio.run(authorize.run_async(authorizer))
+
+        expected: List[Tuple[str, str, str, str]] = [
+            ("grant", "alice", "read", "hello_world"),
+            ("grant", "bob", "read", "music_nerd"),
+            ("revoke", "alice", "read", "hello_world"),
+        ]
+        self.assertEqual(expected, authorizer.calls)
+        self.assertEqual(1, authorizer.entered)
+
+    def test_bad_batch_line_fails_before_connecting(self):
+        """
+        Tests that a bad line anywhere in a batch file is reported by its line number
+        like any other command line error, before the authorizer context is ever entered.
+        """
+        batch_file: str = self.write_batch_file(
+            [
+                "# Comment",
+                "--user alice --network hello_world",
+                "--user bob --netwrk music_nerd",
+            ]
+        )
+        authorize = Authorize()
+        authorize.parse_args(["--batch-file", batch_file])
+        authorizer = FakeAuthorizer()
+
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            with self.assertRaises(SystemExit) as context:
+                asyncio.run(authorize.run_async(authorizer))
+
+        self.assertEqual(2, context.exception.code)
+        self.assertIn("batch.txt line 3: unrecognized arguments: --netwrk", stderr.getvalue())
+        self.assertEqual(0, authorizer.entered)
+        self.assertEqual([], authorizer.calls)
+
+    def test_bad_batch_files_are_reported(self):
+        """
+        Tests that a missing batch file, help or a nested batch file on a line,
+        and unbalanced quotes are all reported like any other command line error.
+        """
+        missing_file: str = os.path.join(self.temp_dir.name, "missing.txt")
+        for lines, expected in [
+            (None, "No such file or directory"),
+            (["--user alice -h"], "batch.txt line 1: unrecognized arguments: -h"),
+            (["--user alice", "--batch-file other.txt"], "batch.txt line 2: --batch-file cannot be used within"),
+            (["--user alice", "--batch other.txt"], "batch.txt line 2: --batch-file cannot be used within"),
+            (['--user "alice'], "batch.txt line 1: No closing quotation"),
+        ]:
+            batch_file: str = missing_file if lines is None else self.write_batch_file(lines)
+            authorize = Authorize()
+            authorize.parse_args(["--batch-file", batch_file])
+
+            with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+                with self.assertRaises(SystemExit, msg=lines) as context:
+                    authorize.get_all_args()
+
+            self.assertEqual(2, context.exception.code, lines)
+            self.assertIn(expected, stderr.getvalue())
+
+    def test_batch_file_rejects_line_args_on_command_line(self):
+        """
+        Tests that arguments each batch line gives for itself cannot also be given on the command line.
+        """
+        batch_file: str = self.write_batch_file(["--user alice --network hello_world"])
+        for command_line in [
+            ["--user", "nobody", "--batch-file", batch_file],
+            ["--batch-file", batch_file, "--network=hello_world"],
+            ["--batch-file", batch_file, "--revoke"],
+            ["--batch-file", batch_file, "--rev"],
+            ["--batch-file", batch_file, "--us", "nobody"],
+            ["--batch-file", batch_file, "--grant"],
+        ]:
+            with self.assertRaises(SystemExit, msg=command_line):
+                with patch("sys.stderr"):
+                    Authorize().parse_args(command_line)
+
+        # On their own, every other argument is still allowed
+        authorize = Authorize()
+        authorize.parse_args(["--batch-f", batch_file])
+        self.assertEqual(batch_file, authorize.args.batch_file)
+
+    def test_repeated_grant_skips_server(self):
+        """
+        Tests that granting what was already granted earlier in the same run does not go back to the server.
+        """
+        batch_file: str = self.write_batch_file(
+            [
+                "--user alice --network hello_world",
+                '--user "alice bob" --network hello_world',
+            ]
+        )
+        authorize = Authorize()
+        authorize.parse_args(["--batch-file", batch_file])
+        authorizer = FakeAuthorizer()
+
+        asyncio.run(authorize.run_async(authorizer))
+
+        expected: List[Tuple[str, str, str, str]] = [
+            ("grant", "alice", "read", "hello_world"),
+            ("grant", "bob", "read", "hello_world"),
+        ]
+        self.assertEqual(expected, authorizer.calls)
+
+    def test_revoke_then_grant(self):
+        """
+        Tests that a grant after a revoke in the same batch goes back to the server,
+        rather than being taken as already granted.
+        """
+        batch_file: str = self.write_batch_file(
+            [
+                "--user alice --network hello_world",
+                "--user alice --network hello_world --revoke",
+                "--user alice --network hello_world --grant",
+            ]
+        )
+        authorize = Authorize()
+        authorize.parse_args(["--batch-file", batch_file])
+        authorizer = FakeAuthorizer()
+
+        asyncio.run(authorize.run_async(authorizer))
+
+        expected: List[Tuple[str, str, str, str]] = [
+            ("grant", "alice", "read", "hello_world"),
+            ("revoke", "alice", "read", "hello_world"),
+            ("grant", "alice", "read", "hello_world"),
+        ]
+        self.assertEqual(expected, authorizer.calls)
+        self.assertIn(("alice", "read", "hello_world"), authorizer.relations)
+
+
+class TestManifestCache(TestCase):
+    """
+    Unit tests for the on-disk cache of the network names in the manifest.
+    """
+
+    def setUp(self):
+        """
+        Set up a manifest and a cache home in a scratch directory,
+        and count how many times the manifest is actually read.
+        The manifest serves hello_world, whose file exists, and music_nerd, whose file does not yet.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.registry_dir: str = os.path.join(self.temp_dir.name, "registries")
+        os.makedirs(self.registry_dir)
+        self.manifest_file: str = os.path.join(self.registry_dir, "manifest.hocon")
+        with open(self.manifest_file, "w", encoding="utf-8") as manifest:
+            manifest.write('"hello_world.hocon": true\n"music_nerd.hocon": true\n"unserved.hocon": false\n')
+        self.touch(os.path.join(self.registry_dir, "hello_world.hocon"))
+
+        self.cache_home: str = os.path.join(self.temp_dir.name, "cache")
+        environ_patch = patch.dict(
+            os.environ, {"AGENT_MANIFEST_FILE": self.manifest_file, "XDG_CACHE_HOME": self.cache_home}
+        )
+        environ_patch.start()
+        self.addCleanup(environ_patch.stop)
+
+        self.storages: Dict[str, Dict[str, Any]] = {"manifest.hocon": {"hello_world": {}, "music_nerd": {}}}
+        restore_patch = patch(
+            "plugins.authorization.openfga.authorize.load_manifest_storages", side_effect=lambda: self.storages
+        )
+        self.restore = restore_patch.start()
+        self.addCleanup(restore_patch.stop)
+
+    @staticmethod
+    def touch(path: str):
+        """
+        Writes the file and moves its modification time on, so the change is always seen.
+        :param path: The path to the file
+        """
+        mtime_ns: int = 0
+        if os.path.exists(path):
+            mtime_ns = os.stat(path).st_mtime_ns + 1_000_000_000
+        with open(path, "a", encoding="utf-8") as manifest:
+            manifest.write("# Changed\n")
+        if mtime_ns:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def get_cache_files(self) -> List[str]:
+        """
+        :return: The names of all the files in the cache directory
+        """
+        return sorted(os.listdir(os.path.join(self.cache_home, "neuro-san")))
+
+    def test_cached_until_manifest_changes(self):
+        """
+        Tests that the manifest is only read again once it or a manifest it includes changes,
+        and not when some file it does not depend on does.
+        """
+        included_file: str = os.path.join(self.registry_dir, "included.hocon")
+        with open(self.manifest_file, "a", encoding="utf-8") as manifest:
+            manifest.write(f'include "{included_file}"\n')
+        self.touch(included_file)
+
+        self.assertEqual(["hello_world", "music_nerd"], load_manifest_network_names())
+        self.assertEqual(["hello_world", "music_nerd"], load_manifest_network_names())
+        self.assertEqual(1, self.restore.call_count)
+
+        self.touch(os.path.join(self.registry_dir, "notes.txt"))
+        self.touch(os.path.join(self.registry_dir, "unserved.hocon"))
+        self.assertEqual(["hello_world", "music_nerd"], load_manifest_network_names())
+        self.assertEqual(1, self.restore.call_count)
+
+        self.storages = {"manifest.hocon": {"hello_world": {}}}
+        self.touch(included_file)
+        self.assertEqual(["hello_world"], load_manifest_network_names())
+        self.assertEqual(2, self.restore.call_count)
+
+    def test_cached_until_agent_file_changes(self):
+        """
+        Tests that the manifest is read again once the agent network file of a served entry changes
+        or shows up, as restoring the manifest leaves out networks whose files are missing or broken.
+        """
+        self.storages = {"manifest.hocon": {"hello_world": {}}}
+        self.assertEqual(["hello_world"], load_manifest_network_names())
+        self.assertEqual(1, self.restore.call_count)
+
+        self.storages = {"manifest.hocon": {"hello_world": {}, "music_nerd": {}}}
+        self.touch(os.path.join(self.registry_dir, "music_nerd.hocon"))
+        self.assertEqual(["hello_world", "music_nerd"], load_manifest_network_names())
+        self.assertEqual(2, self.restore.call_count)
+
+        self.storages = {"manifest.hocon": {"music_nerd": {}}}
+        self.touch(os.path.join(self.registry_dir, "hello_world.hocon"))
+        self.assertEqual(["music_nerd"], load_manifest_network_names())
+        self.assertEqual(3, self.restore.call_count)
+
+    def test_one_cache_file_per_manifest(self):
+        """
+        Tests that a changed manifest replaces its cache file rather than adding another.
+        """
+        load_manifest_network_names()
+        self.touch(self.manifest_file)
+        load_manifest_network_names()
+
+        self.assertEqual([os.path.basename(get_manifest_cache_file())], self.get_cache_files())
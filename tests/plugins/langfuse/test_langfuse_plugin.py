@@ -0,0 +1,239 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import threading
+from typing import Any
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from plugins.langfuse.langfuse_plugin import LangfusePlugin
+
+LOGGER_NAME: str = "plugins.langfuse.langfuse_plugin"
+
+
+class FakeLangfuse:  # pylint: disable=too-few-public-methods
+    """
+    Stands in for the langfuse.Langfuse client class.
+    Remembers every client created and can hold up flush() until told to go on.
+    """
+
+    instances: List["FakeLangfuse"] = []
+
+    def __init__(self, **kwargs: Any):
+        """
+        Constructor
+        """
+        self.kwargs = kwargs
+        self.flushes: int = 0
+        self.release_flush: threading.Event = None
+        FakeLangfuse.instances.append(self)
+
+    def flush(self):
+        """
+        Waits for release_flush, if there is one, before counting the flush.
+        """
+        if self.release_flush is not None:
+            self.release_flush.wait(timeout=5)
+        self.flushes += 1
+
+
+class TestLangfusePlugin(TestCase):
+    """
+    Unit tests for the process-wide initialization state of the LangfusePlugin,
+    run against a FakeLangfuse client class.
+    """
+
+    def setUp(self):
+        """
+        Start every test from a process where Langfuse was never initialized,
+        with a fake client class and a count of how often the OpenAI module is patched.
+        """
+        FakeLangfuse.instances = []
+        environ_patch = patch.dict(
+            os.environ,
+            {
+                "LANGFUSE_ENABLED": "true",
+                "LANGFUSE_USE_EXISTING": "false",
+                "LANGFUSE_SECRET_KEY": "secret",
+                "LANGFUSE_PUBLIC_KEY": "public",
+            },
+        )
+        for patcher in [
+            environ_patch,
+            patch.object(LangfusePlugin, "_langfuse_class", FakeLangfuse),
+            patch.object(LangfusePlugin, "_process_state", None),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patch_openai = patch.object(LangfusePlugin, "_patch_openai_module")
+        self.patch_openai: MagicMock = patch_openai.start()
+        self.addCleanup(patch_openai.stop)
+
+    def test_instances_share_one_client(self):
+        """
+        Tests that initializing a second instance, even from another thread,
+        adopts the first one's client rather than creating another.
+        """
+        first = LangfusePlugin()
+        first.initialize()
+
+        second = LangfusePlugin()
+        thread = threading.Thread(target=second.initialize)
+        thread.start()
+        thread.join()
+
+        self.assertTrue(first.is_initialized)
+        self.assertTrue(second.is_initialized)
+        self.assertEqual(1, len(FakeLangfuse.instances))
+        self.assertIs(first.langfuse_client, second.langfuse_client)
+        self.assertEqual(1, self.patch_openai.call_count)
+
+    def test_new_pid_initializes_again(self):
+        """
+        Tests that a process with a different PID, like a forked child, does not adopt the parent's client.
+        """
+        parent = LangfusePlugin()
+        parent.initialize()
+        LangfusePlugin._process_state = (os.getpid() + 1, parent.langfuse_client)  # pylint: disable=protected-access
+
+        child = LangfusePlugin()
+        child.initialize()
+
+        self.assertTrue(child.is_initialized)
+        self.assertEqual(2, len(FakeLangfuse.instances))
+        self.assertIs(FakeLangfuse.instances[1], child.langfuse_client)
+        self.assertEqual((os.getpid(), child.langfuse_client), LangfusePlugin._process_state)  # pylint: disable=protected-access
+
+    def test_release_between_checks_is_not_adopted(self):
+        """
+        Tests that an instance checking the process-wide state while another instance
+        releases it either adopts a working client or initializes one of its own,
+        and never ends up initialized without a client.
+        """
+        first = LangfusePlugin()
+        first.initialize()
+
+        second = LangfusePlugin()
+        original_getpid = os.getpid
+
+        def release_during_check() -> int:
+            # Another instance shuts down right after the shared state was read
+            first.shutdown()
+            return original_getpid()
+
+        with patch("plugins.langfuse.langfuse_plugin.os.getpid", side_effect=release_during_check):
+            adopted: bool = second._adopt_process_initialization()  # pylint: disable=protected-access
+
+        self.assertTrue(adopted)
+        self.assertIs(FakeLangfuse.instances[0], second.langfuse_client)
+
+        third = LangfusePlugin()
+        third.initialize()
+        self.assertTrue(third.is_initialized)
+        self.assertIsNotNone(third.langfuse_client)
+
+    def test_callback_handler_per_call(self):
+        """
+        Tests that each call gets its own callback handler, as handlers keep per-run state,
+        while the handler type is only resolved once.
+        """
+        plugin = LangfusePlugin()
+        plugin.initialize()
+
+        with patch.object(LangfusePlugin, "_callback_handler_class", None):
+            with patch(
+                "plugins.langfuse.langfuse_plugin.ResolverUtil.create_type", return_value=MagicMock
+            ) as create_type:
+                first = plugin.get_callback_handler()
+                second = plugin.get_callback_handler()
+
+        self.assertIsNotNone(first)
+        self.assertIsNot(first, second)
+        self.assertEqual(1, create_type.call_count)
+
+    def test_shutdown_lets_next_instance_initialize(self):
+        """
+        Tests that after shutdown() the next instance sets up a new client of its own.
+        """
+        first = LangfusePlugin()
+        first.initialize()
+        first.shutdown()
+
+        self.assertFalse(first.is_initialized)
+        self.assertEqual(1, FakeLangfuse.instances[0].flushes)
+
+        second = LangfusePlugin()
+        second.initialize()
+
+        self.assertTrue(second.is_initialized)
+        self.assertEqual(2, len(FakeLangfuse.instances))
+        self.assertIs(FakeLangfuse.instances[1], second.langfuse_client)
+
+    def test_ashutdown_timeout_still_releases(self):
+        """
+        Tests that an ashutdown() whose flush takes too long warns about it
+        and still lets the next instance initialize.
+        """
+        first = LangfusePlugin()
+        first.initialize()
+        release_flush = threading.Event()
+        first.langfuse_client.release_flush = release_flush
+
+        async def shutdown_then_release():
+            try:
+                await first.ashutdown(timeout=0.01)
+            finally:
+                # Let the flush still running in its worker thread finish
+                release_flush.set()
+
+        with self.assertLogs(LOGGER_NAME, level="WARNING") as logs:
+            asyncio.run(shutdown_then_release())
+
+        self.assertIn("Timed out", "\n".join(logs.output))
+        self.assertFalse(first.is_initialized)
+
+        second = LangfusePlugin()
+        second.initialize()
+        self.assertEqual(2, len(FakeLangfuse.instances))
+
+    def test_set_environment_variables_writes_only_changes(self):
+        """
+        Tests that only the environment variables whose values change are written.
+        """
+        plugin = LangfusePlugin({"langfuse_enabled": "true", "langfuse_project_name": "demo"})
+        plugin.set_environment_variables()
+        self.assertEqual("demo", os.environ["LANGFUSE_PROJECT_NAME"])
+
+        os.environ["LANGFUSE_PROJECT_NAME"] = "old"
+        with patch("os.putenv") as putenv:
+            with self.assertLogs(LOGGER_NAME, level="INFO") as logs:
+                plugin.set_environment_variables()
+
+        self.assertEqual(1, putenv.call_count)
+        self.assertIn("Langfuse env set: ['LANGFUSE_PROJECT_NAME']", "\n".join(logs.output))
+        self.assertEqual("demo", os.environ["LANGFUSE_PROJECT_NAME"])
+
+        with patch("os.putenv") as putenv:
+            with self.assertLogs(LOGGER_NAME, level="INFO") as logs:
+                plugin.set_environment_variables()
+
+        putenv.assert_not_called()
+        self.assertIn("Langfuse env set: []", "\n".join(logs.output))
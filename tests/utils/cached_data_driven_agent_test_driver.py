@@ -0,0 +1,41 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+
+from neuro_san.test.driver.data_driven_agent_test_driver import DataDrivenAgentTestDriver
+
+from tests.utils.hocon_cache import load_hocon
+
+
+class CachedDataDrivenAgentTestDriver(DataDrivenAgentTestDriver):
+    """
+    DataDrivenAgentTestDriver that reads its hocon test cases through the shared hocon cache
+    instead of parsing each file anew every time a test case is run.
+    """
+
+    def parse_hocon_test_case(self, hocon_file: str) -> Dict[str, Any]:
+        """
+        Use a single hocon file in the fixtures as a test case
+
+        :param hocon_file: The name of the hocon from the fixtures directory.
+        """
+        test_path: str = hocon_file
+        if self.fixtures is not None:
+            test_path = self.fixtures.get_file_in_basis(hocon_file)
+        test_case: Dict[str, Any] = load_hocon(test_path)
+        return test_case
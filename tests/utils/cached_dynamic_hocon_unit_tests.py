@@ -0,0 +1,117 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import List
+from unittest import TestCase
+
+from neuro_san.test.unittest.dynamic_hocon_unit_tests import DynamicHoconUnitTests
+from neuro_san.test.unittest.unit_test_assert_forwarder import UnitTestAssertForwarder
+
+from tests.utils.cached_data_driven_agent_test_driver import CachedDataDrivenAgentTestDriver
+from tests.utils.hocon_pass_cache import HoconPassCache
+
+
+class CachedDynamicHoconUnitTests(DynamicHoconUnitTests):
+    """
+    DynamicHoconUnitTests that runs each test case with a CachedDataDrivenAgentTestDriver,
+    so that any given hocon test case file is only parsed once.
+
+    When given a HoconPassCache, test cases that passed before and whose files
+    have not changed since are skipped. Sequences of test cases that build on one
+    another are skipped or run as a whole.
+    """
+
+    # Shared by every instance, as it is set up once per pytest session
+    _pass_cache: HoconPassCache = None
+
+    @classmethod
+    def set_pass_cache(cls, pass_cache: HoconPassCache):
+        """
+        :param pass_cache: The HoconPassCache to consult before running each test case.
+                    None means always run every test case.
+        """
+        cls._pass_cache = pass_cache
+
+    def one_test_hocon(self, test_case: TestCase, test_name: str, test_hocon: str, use_pass_cache: bool = True):
+        """
+        Entry point for test functions parameterized with @pytest.mark.parametrize.
+
+        :param test_case: A TestCase instance through which the driver reports its asserts
+                    and skips. A plain TestCase() will do, as pytest understands what it raises.
+        :param test_name: The name of a single test, as given by the parameters
+                    from DynamicHoconUnitTests.from_hocon_list().
+        :param test_hocon: The hocon file to use as a data-driven test case.
+                    This is expanded to use the source_file/path_to_basis information
+                    passed into the constructor.
+        :param use_pass_cache: False to always run the test case, even when there is a HoconPassCache.
+                    Use this for test cases that depend on state left behind by other test cases.
+        """
+        # Find a full path to the test hocon file
+        test_hocon_file: str = self.fixture_basis.get_file_in_basis(test_hocon)
+
+        pass_cache: HoconPassCache = self._pass_cache if use_pass_cache else None
+        if pass_cache is not None and pass_cache.is_unchanged_since_pass(test_hocon_file):
+            test_case.skipTest("unchanged since last pass")
+
+        # Any failure raises, so getting past this means it passed.
+        self.run_test_hocon_file(test_case, test_name, test_hocon_file)
+
+        if pass_cache is not None:
+            pass_cache.record_pass(test_hocon_file)
+
+    def one_test_hocon_sequence(self, test_case: TestCase, expansions: List[List[str]]):
+        """
+        Runs several test cases that build on one another in order, as a single unit,
+        stopping at the first one that fails.
+
+        With a HoconPassCache, the whole sequence is skipped only when every one of its
+        test cases is unchanged since it last passed. Otherwise every test case is run,
+        and passes are only recorded once the whole sequence has passed.
+
+        :param test_case: A TestCase instance through which the driver reports its asserts and skips.
+        :param expansions: The (test_name, test_hocon) pairs for each test case in order,
+                    as given by DynamicHoconUnitTests.from_hocon_list().
+        """
+        test_hocon_files: List[str] = []
+        for _, test_hocon in expansions:
+            test_hocon_files.append(self.fixture_basis.get_file_in_basis(test_hocon))
+
+        pass_cache: HoconPassCache = self._pass_cache
+        if pass_cache is not None and all(
+            pass_cache.is_unchanged_since_pass(test_hocon_file) for test_hocon_file in test_hocon_files
+        ):
+            test_case.skipTest("unchanged since last pass")
+
+        for (test_name, _), test_hocon_file in zip(expansions, test_hocon_files):
+            self.run_test_hocon_file(test_case, test_name, test_hocon_file)
+
+        if pass_cache is not None:
+            for test_hocon_file in test_hocon_files:
+                pass_cache.record_pass(test_hocon_file)
+
+    @staticmethod
+    def run_test_hocon_file(test_case: TestCase, test_name: str, test_hocon_file: str):
+        """
+        :param test_case: A TestCase instance through which the driver reports its asserts and skips.
+        :param test_name: The name of a single test.
+        :param test_hocon_file: The full path to the hocon file to use as a data-driven test case.
+        """
+        # Set up the driver
+        asserts = UnitTestAssertForwarder(test_case)
+        driver = CachedDataDrivenAgentTestDriver(asserts, test_name=test_name)
+
+        # Run the test
+        driver.one_test(test_hocon_file)
@@ -0,0 +1,122 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import hashlib
+import json
+import os
+import re
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from leaf_common.persistence.easy.easy_hocon_persistence import EasyHoconPersistence
+
+# Matches the file name in hocon lines like: include "registries/aaosa_basic.hocon"
+INCLUDE_REGEX = re.compile(r'^\s*include\s+"([^"]+)"', re.MULTILINE)
+
+
+class HoconCacheSettings:  # pylint: disable=too-few-public-methods
+    """
+    Holds the settings shared by every load_hocon() call in the process.
+    """
+
+    # Directory where parsed hocon files are persisted across pytest sessions.
+    # This is set from pytest's own cache directory at startup. None means keep them in memory only.
+    cache_dir: Optional[str] = None
+
+
+def set_hocon_cache_dir(cache_dir: Optional[str]):
+    """
+    :param cache_dir: The directory where parsed hocon files are persisted across pytest sessions,
+                or None to only keep them in memory.
+    """
+    HoconCacheSettings.cache_dir = cache_dir
+
+
+def load_hocon(hocon_file: str) -> Dict[str, Any]:
+    """
+    Load a hocon file, parsing it only when it has not been seen before.
+
+    Parsed results are kept in memory for the life of the process and on disk
+    between pytest sessions. Both are keyed by the absolute path and modification
+    time of the file, so editing the file invalidates any cached copy.
+
+    :param hocon_file: The path to the hocon file to load
+    :return: A dictionary of the contents of the hocon file.
+            Callers get their own copy which they are free to modify.
+    """
+    path: str = os.path.abspath(hocon_file)
+    mtime_ns: int = os.stat(path).st_mtime_ns
+    return deepcopy(_load_hocon(path, mtime_ns))
+
+
+@lru_cache(maxsize=None)
+def _load_hocon(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    :param path: The absolute path to the hocon file to load
+    :param mtime_ns: The modification time of the file
+    :return: A dictionary of the contents of the hocon file
+    """
+    cache_dir: Optional[str] = HoconCacheSettings.cache_dir
+    cache_file: Optional[str] = None
+    if cache_dir is not None:
+        # One cache file per hocon file, so that a stale copy is replaced rather than left behind
+        key: str = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        cache_file = os.path.join(cache_dir, f"{key}.json")
+        try:
+            with open(cache_file, "r", encoding="utf-8") as cached:
+                entry: Dict[str, Any] = json.load(cached)
+            if entry.get("mtime_ns") == mtime_ns:
+                return entry["contents"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            # Not cached on disk yet (or unreadable). Parse it below.
+            pass
+
+    hocon = EasyHoconPersistence(must_exist=True)
+    contents: Dict[str, Any] = hocon.restore(file_reference=path)
+
+    if cache_file is None:
+        return contents
+
+    # Substitutions like ${?SOME_ENV_VAR} can resolve differently from run to run,
+    # and included files can change without this file's modification time changing,
+    # so only persist files whose contents depend on nothing but the file itself.
+    with open(path, "r", encoding="utf-8") as hocon_text:
+        text: str = hocon_text.read()
+    has_dependencies: bool = "${" in text or INCLUDE_REGEX.search(text) is not None
+
+    # Write then rename so that parallel test workers never read a partial file
+    temp_file: str = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        if has_dependencies:
+            # Do not leave a copy from an earlier version of the file behind
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+        else:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(temp_file, "w", encoding="utf-8") as cached:
+                json.dump({"mtime_ns": mtime_ns, "contents": contents}, cached)
+            os.replace(temp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        # Caching is only an optimization, but do not leave a partly written file behind
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+    return contents
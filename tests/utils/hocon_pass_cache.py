@@ -0,0 +1,116 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import hashlib
+import os
+from typing import Any
+from typing import Dict
+from typing import List
+
+from pytest import Cache
+
+from tests.utils.hocon_cache import INCLUDE_REGEX
+from tests.utils.hocon_cache import load_hocon
+
+
+class HoconPassCache:
+    """
+    Remembers which hocon test cases passed, along with a fingerprint of the files
+    they depend on, in pytest's own cache directory.
+
+    A test case whose fingerprint has not changed since it last passed can then be skipped.
+    The fingerprint covers the test case file, the agent network file it tests against,
+    and any files either of those include. It does not cover coded tools or LLM behavior,
+    which is why this is only ever opt-in.
+    """
+
+    # Each test case gets its own cache key under this prefix, so that parallel
+    # pytest-xdist workers never overwrite each other's results.
+    CACHE_KEY_PREFIX: str = "hocon_pass_hashes"
+
+    def __init__(self, cache: Cache):
+        """
+        Constructor
+
+        :param cache: The pytest Cache from the current pytest config
+        """
+        self.cache: Cache = cache
+
+    def is_unchanged_since_pass(self, test_hocon_file: str) -> bool:
+        """
+        :param test_hocon_file: The full path to a hocon test case file
+        :return: True if the test case last passed with exactly the files it depends on now
+        """
+        last_pass: str = self.cache.get(self.get_cache_key(test_hocon_file), None)
+        return last_pass is not None and last_pass == self.fingerprint(test_hocon_file)
+
+    def record_pass(self, test_hocon_file: str):
+        """
+        :param test_hocon_file: The full path to a hocon test case file that just passed
+        """
+        self.cache.set(self.get_cache_key(test_hocon_file), self.fingerprint(test_hocon_file))
+
+    def get_cache_key(self, test_hocon_file: str) -> str:
+        """
+        :param test_hocon_file: The full path to a hocon test case file
+        :return: The key in the pytest cache for the test case
+        """
+        relative_path: str = os.path.relpath(test_hocon_file).replace(os.sep, "/")
+        return f"{self.CACHE_KEY_PREFIX}/{relative_path}"
+
+    def fingerprint(self, test_hocon_file: str) -> str:
+        """
+        :param test_hocon_file: The full path to a hocon test case file
+        :return: A hash of the contents of the test case and all the files it depends on
+        """
+        digest = hashlib.sha256()
+        for file_name in self.get_dependencies(test_hocon_file):
+            digest.update(file_name.encode("utf-8"))
+            try:
+                with open(file_name, "rb") as dependency:
+                    digest.update(dependency.read())
+            except OSError:
+                # A missing file is still part of the fingerprint by way of its name.
+                # If it shows up later, the fingerprint changes.
+                pass
+        return digest.hexdigest()
+
+    def get_dependencies(self, test_hocon_file: str) -> List[str]:
+        """
+        :param test_hocon_file: The full path to a hocon test case file
+        :return: The list of files the test case depends on, starting with itself
+        """
+        dependencies: List[str] = [test_hocon_file]
+
+        test_case: Dict[str, Any] = load_hocon(test_hocon_file)
+        agent: str = test_case.get("agent")
+        if agent:
+            if not agent.endswith(".hocon"):
+                # Agent network names are relative to the directory of the manifest
+                manifest_files: str = os.environ.get("AGENT_MANIFEST_FILE", "registries/manifest.hocon")
+                registry_dir: str = os.path.dirname(manifest_files.split()[0])
+                agent = os.path.join(registry_dir, f"{agent}.hocon")
+            dependencies.append(agent)
+
+        # Includes are given relative to the top of the repo
+        for file_name in list(dependencies):
+            try:
+                with open(file_name, "r", encoding="utf-8") as hocon_text:
+                    dependencies.extend(INCLUDE_REGEX.findall(hocon_text.read()))
+            except OSError:
+                pass
+
+        return dependencies
@@ -0,0 +1,105 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import threading
+from typing import Dict
+
+from leaf_common.time.timeout import Timeout
+from neuro_san.client.agent_session_factory import AgentSessionFactory
+from neuro_san.client.direct_agent_session_factory import DirectAgentSessionFactory
+from neuro_san.interfaces.agent_session import AgentSession
+
+
+class SharedAgentSessionFactory(AgentSessionFactory):
+    """
+    AgentSessionFactory that creates all of its direct sessions from a single
+    DirectAgentSessionFactory that is shared by every instance in the process.
+
+    The stock AgentSessionFactory builds a new DirectAgentSessionFactory for every
+    direct session, and each one of those reads in the whole manifest and every
+    agent network listed in it. Sharing one means that only happens once per
+    test session. Each session still gets its own llm and toolbox factories.
+    """
+
+    _direct_factory: DirectAgentSessionFactory = None
+    _lock = threading.Lock()
+
+    def create_session(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        session_type: str,
+        agent_name: str,
+        hostname: str = None,
+        port: int = None,
+        use_direct: bool = False,
+        metadata: Dict[str, str] = None,
+        connect_timeout_in_seconds: float = None,
+    ) -> AgentSession:
+        """
+        :param session_type: The type of session to create
+        :param agent_name: The name of the agent to use for the session.
+        :param hostname: The name of the host to connect to (if applicable)
+        :param port: The port on the host to connect to (if applicable)
+        :param use_direct: When True, will use a Direct session for
+                    external agents that would reside on the same server.
+        :param metadata: A metadata dictionary of key/value pairs to be inserted into
+                         the header.
+        :param connect_timeout_in_seconds: A timeout in seconds after which attempts
+                        to reach a server will stop. By default this is None,
+                        meaning sessions will try forever.
+        """
+        if session_type != "direct":
+            return super().create_session(
+                session_type,
+                agent_name,
+                hostname=hostname,
+                port=port,
+                use_direct=use_direct,
+                metadata=metadata,
+                connect_timeout_in_seconds=connect_timeout_in_seconds,
+            )
+
+        umbrella_timeout: Timeout = None
+        if connect_timeout_in_seconds is not None:
+            umbrella_timeout = Timeout()
+            umbrella_timeout.set_limit_in_seconds(connect_timeout_in_seconds)
+
+        factory: DirectAgentSessionFactory = self.get_direct_factory()
+        return factory.create_session(
+            agent_name, use_direct=use_direct, metadata=metadata, umbrella_timeout=umbrella_timeout
+        )
+
+    @classmethod
+    def get_direct_factory(cls) -> DirectAgentSessionFactory:
+        """
+        :return: The DirectAgentSessionFactory shared by all instances,
+                creating it on first use.
+        """
+        # Test case iterations can run on multiple threads at once,
+        # so make sure only one of them reads in the manifest.
+        if cls._direct_factory is None:
+            with cls._lock:
+                if cls._direct_factory is None:
+                    cls._direct_factory = DirectAgentSessionFactory()
+        return cls._direct_factory
+
+    @classmethod
+    def reset(cls):
+        """
+        Forget the shared DirectAgentSessionFactory so the next direct session
+        reads in the manifest again.
+        """
+        with cls._lock:
+            cls._direct_factory = None
@@ -0,0 +1,155 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from typing import List
+from typing import Set
+from unittest import SkipTest
+from unittest import TestCase
+from unittest.mock import patch
+
+from tests.utils.cached_dynamic_hocon_unit_tests import CachedDynamicHoconUnitTests
+
+
+class FakePassCache:
+    """
+    Stands in for a HoconPassCache, where a test case is unchanged once it has passed.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.passed: Set[str] = set()
+
+    def is_unchanged_since_pass(self, test_hocon_file: str) -> bool:
+        """
+        :return: True if the test case has passed before
+        """
+        return test_hocon_file in self.passed
+
+    def record_pass(self, test_hocon_file: str):
+        """
+        Remembers that the test case passed
+        """
+        self.passed.add(test_hocon_file)
+
+
+class TestCachedDynamicHoconUnitTests(TestCase):
+    """
+    Unit tests for the pass cache handling of CachedDynamicHoconUnitTests,
+    with the data-driven test driver stubbed out.
+    """
+
+    STEPS: List[str] = ["step_1.hocon", "step_2.hocon", "step_3.hocon"]
+
+    def setUp(self):
+        """
+        Set up a pass cache and stub out the driver, remembering which files it was asked to run.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+        self.dynamic = CachedDynamicHoconUnitTests(
+            os.path.join(self.temp_dir.name, "test_steps.py"), path_to_basis="."
+        )
+
+        self.pass_cache = FakePassCache()
+        CachedDynamicHoconUnitTests.set_pass_cache(self.pass_cache)
+        self.addCleanup(CachedDynamicHoconUnitTests.set_pass_cache, None)
+
+        self.ran: List[str] = []
+        self.failing: str = None
+        driver_patch = patch.object(CachedDynamicHoconUnitTests, "run_test_hocon_file", side_effect=self.run_stub)
+        driver_patch.start()
+        self.addCleanup(driver_patch.stop)
+
+    def run_stub(self, test_case: TestCase, test_name: str, test_hocon_file: str):
+        """
+        Stands in for running a test case, failing the one named by self.failing
+        """
+        _ = test_case, test_name
+        self.ran.append(os.path.basename(test_hocon_file))
+        if self.failing is not None and test_hocon_file.endswith(self.failing):
+            raise AssertionError(f"{self.failing} failed")
+
+    def get_file(self, test_hocon: str) -> str:
+        """
+        :return: The full path the test case is expected to resolve to
+        """
+        return self.dynamic.fixture_basis.get_file_in_basis(test_hocon)
+
+    def run_sequence(self):
+        """
+        Runs all the steps as a sequence
+        """
+        expansions: List[List[str]] = [[step.replace(".hocon", ""), step] for step in self.STEPS]
+        self.dynamic.one_test_hocon_sequence(TestCase(), expansions)
+
+    def test_one_test_hocon_skips_unchanged(self):
+        """
+        Tests that a single test case is skipped once it has passed, unless told not to use the pass cache.
+        """
+        self.dynamic.one_test_hocon(TestCase(), "step_1", "step_1.hocon")
+        self.assertEqual({self.get_file("step_1.hocon")}, self.pass_cache.passed)
+
+        with self.assertRaises(SkipTest):
+            self.dynamic.one_test_hocon(TestCase(), "step_1", "step_1.hocon")
+
+        self.dynamic.one_test_hocon(TestCase(), "step_1", "step_1.hocon", use_pass_cache=False)
+        self.assertEqual(["step_1.hocon", "step_1.hocon"], self.ran)
+
+    def test_one_test_hocon_failure_is_not_recorded(self):
+        """
+        Tests that a failing test case is not recorded as passed.
+        """
+        self.failing = "step_1.hocon"
+        with self.assertRaises(AssertionError):
+            self.dynamic.one_test_hocon(TestCase(), "step_1", "step_1.hocon")
+        self.assertEqual(set(), self.pass_cache.passed)
+
+    def test_sequence_skipped_when_all_unchanged(self):
+        """
+        Tests that a sequence is skipped only when every one of its steps is unchanged.
+        """
+        self.run_sequence()
+        self.assertEqual(self.STEPS, self.ran)
+
+        with self.assertRaises(SkipTest):
+            self.run_sequence()
+        self.assertEqual(self.STEPS, self.ran)
+
+    def test_sequence_runs_every_step_when_one_changed(self):
+        """
+        Tests that when any one step of a sequence has changed, every step runs again.
+        """
+        self.pass_cache.record_pass(self.get_file("step_1.hocon"))
+        self.pass_cache.record_pass(self.get_file("step_3.hocon"))
+
+        self.run_sequence()
+        self.assertEqual(self.STEPS, self.ran)
+
+    def test_sequence_failure_records_nothing(self):
+        """
+        Tests that when a step of a sequence fails, the rest do not run
+        and no step is recorded as passed, not even the ones before it.
+        """
+        self.failing = "step_2.hocon"
+        with self.assertRaises(AssertionError):
+            self.run_sequence()
+
+        self.assertEqual(["step_1.hocon", "step_2.hocon"], self.ran)
+        self.assertEqual(set(), self.pass_cache.passed)
@@ -0,0 +1,127 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from types import SimpleNamespace
+from typing import Any
+from typing import Generator
+from unittest import TestCase
+
+import pytest
+
+from tests.integration.conftest import pytest_runtest_makereport
+from tests.integration.conftest import pytest_runtest_setup
+
+
+class FakeItem:  # pylint: disable=too-few-public-methods
+    """
+    Stands in for a pytest Item with just what the fail-fast hooks look at.
+    """
+
+    def __init__(self, nodeid: str, config: Any, fail_fast: bool = True):
+        """
+        Constructor
+
+        :param nodeid: The node id of the test case
+        :param config: The config shared by all the test cases in the session
+        :param fail_fast: True if the test case is marked with @pytest.mark.fail_fast
+        """
+        self.nodeid: str = nodeid
+        self.config: Any = config
+        self.fail_fast: bool = fail_fast
+
+    def get_closest_marker(self, name: str) -> Any:
+        """
+        :return: A marker for fail_fast when the test case has one, otherwise None
+        """
+        if name == "fail_fast" and self.fail_fast:
+            return pytest.mark.fail_fast.mark
+        return None
+
+
+class TestFailFast(TestCase):
+    """
+    Unit tests for the fail-fast hooks in the integration conftest.py,
+    called directly with stand-ins for the pytest items and reports.
+    """
+
+    def setUp(self):
+        """
+        Set up a config shared by all the test cases, like in a single pytest session.
+        """
+        self.config = SimpleNamespace(stash=pytest.Stash())
+
+    @staticmethod
+    def report(item: FakeItem, failed: bool):
+        """
+        Runs the makereport hook for a test case the way pytest's hook wrapper would.
+
+        :param item: The test case to report on
+        :param failed: True if the test case failed
+        """
+        wrapper: Generator = pytest_runtest_makereport(item)
+        next(wrapper)
+        outcome = SimpleNamespace(failed=failed)
+        try:
+            wrapper.send(outcome)
+        except StopIteration as stop:
+            assert stop.value is outcome
+
+    def test_failure_skips_rest_of_group(self):
+        """
+        Tests that once a case fails, the remaining cases of the same test function are skipped.
+        """
+        first = FakeItem("tests/integration/test_hocons.py::test_group[case_1]", self.config)
+        second = FakeItem("tests/integration/test_hocons.py::test_group[case_2]", self.config)
+
+        pytest_runtest_setup(first)
+        self.report(first, failed=True)
+
+        with self.assertRaises(pytest.skip.Exception):
+            pytest_runtest_setup(second)
+
+    def test_pass_does_not_skip(self):
+        """
+        Tests that passing cases do not skip the rest of the group.
+        """
+        first = FakeItem("tests/integration/test_hocons.py::test_group[case_1]", self.config)
+        second = FakeItem("tests/integration/test_hocons.py::test_group[case_2]", self.config)
+
+        self.report(first, failed=False)
+        pytest_runtest_setup(second)
+
+    def test_failure_does_not_skip_other_groups(self):
+        """
+        Tests that a failure only skips cases of its own test function,
+        and never cases without the fail_fast marker.
+        """
+        failing = FakeItem("tests/integration/test_hocons.py::test_group[case_1]", self.config)
+        other_group = FakeItem("tests/integration/test_hocons.py::test_other_group[case_1]", self.config)
+        unmarked = FakeItem("tests/integration/test_hocons.py::test_group[case_2]", self.config, fail_fast=False)
+
+        self.report(failing, failed=True)
+
+        pytest_runtest_setup(other_group)
+        pytest_runtest_setup(unmarked)
+
+    def test_unmarked_failure_does_not_skip(self):
+        """
+        Tests that a failure of a case without the fail_fast marker skips nothing.
+        """
+        unmarked = FakeItem("tests/integration/test_hocons.py::test_group[case_1]", self.config, fail_fast=False)
+        marked = FakeItem("tests/integration/test_hocons.py::test_group[case_2]", self.config)
+
+        self.report(unmarked, failed=True)
+        pytest_runtest_setup(marked)
@@ -0,0 +1,156 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+import os
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+from tests.utils.hocon_cache import HoconCacheSettings
+from tests.utils.hocon_cache import _load_hocon
+from tests.utils.hocon_cache import load_hocon
+
+
+class TestHoconCache(TestCase):
+    """
+    Unit tests for the parsed hocon cache, in memory and on disk.
+    """
+
+    def setUp(self):
+        """
+        Set up a scratch directory for hocon files and a cache directory for their parsed copies.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.cache_dir: str = os.path.join(self.temp_dir.name, "cache")
+        cache_dir_patch = patch.object(HoconCacheSettings, "cache_dir", self.cache_dir)
+        cache_dir_patch.start()
+        self.addCleanup(cache_dir_patch.stop)
+
+        self.hocon_file: str = os.path.join(self.temp_dir.name, "test_case.hocon")
+        self.write('{ "agent": "hello_world", "interactions": [ { "text": "hi" } ] }')
+
+    def write(self, contents: str, mtime_ns: int = None):
+        """
+        :param contents: The new contents of the hocon file
+        :param mtime_ns: The modification time to give the file.
+                    None means one second later than it was, so the change is always seen.
+        """
+        if mtime_ns is None and os.path.exists(self.hocon_file):
+            mtime_ns = os.stat(self.hocon_file).st_mtime_ns + 1_000_000_000
+        with open(self.hocon_file, "w", encoding="utf-8") as hocon_text:
+            hocon_text.write(contents)
+        if mtime_ns is not None:
+            os.utime(self.hocon_file, ns=(mtime_ns, mtime_ns))
+
+    def get_cache_files(self) -> List[str]:
+        """
+        :return: The names of all the files in the cache directory
+        """
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return sorted(os.listdir(self.cache_dir))
+
+    def test_keyed_by_mtime(self):
+        """
+        Tests that a file is parsed again when its modification time changes, and only then.
+        """
+        self.assertEqual("hello_world", load_hocon(self.hocon_file)["agent"])
+        mtime_ns: int = os.stat(self.hocon_file).st_mtime_ns
+
+        self.write('{ "agent": "music_nerd" }', mtime_ns=mtime_ns)
+        self.assertEqual("hello_world", load_hocon(self.hocon_file)["agent"])
+
+        self.write('{ "agent": "music_nerd" }')
+        self.assertEqual("music_nerd", load_hocon(self.hocon_file)["agent"])
+
+    def test_callers_get_a_copy(self):
+        """
+        Tests that changes a caller makes to what it loaded are not seen by later callers.
+        """
+        contents: Dict[str, Any] = load_hocon(self.hocon_file)
+        contents["agent"] = "changed"
+        contents["interactions"][0]["text"] = "changed"
+
+        reloaded: Dict[str, Any] = load_hocon(self.hocon_file)
+        self.assertEqual("hello_world", reloaded["agent"])
+        self.assertEqual("hi", reloaded["interactions"][0]["text"])
+
+    def test_read_from_disk(self):
+        """
+        Tests that a file parsed in an earlier session is read from disk rather than parsed again.
+        """
+        load_hocon(self.hocon_file)
+        _load_hocon.cache_clear()
+
+        with patch("tests.utils.hocon_cache.EasyHoconPersistence", side_effect=AssertionError("parsed again")):
+            self.assertEqual("hello_world", load_hocon(self.hocon_file)["agent"])
+
+    def test_one_cache_file_per_path(self):
+        """
+        Tests that a changed file replaces its copy on disk rather than adding another.
+        """
+        load_hocon(self.hocon_file)
+        self.write('{ "agent": "music_nerd" }')
+        load_hocon(self.hocon_file)
+
+        cache_files: List[str] = self.get_cache_files()
+        self.assertEqual(1, len(cache_files))
+        with open(os.path.join(self.cache_dir, cache_files[0]), "r", encoding="utf-8") as cached:
+            entry: Dict[str, Any] = json.load(cached)
+        self.assertEqual(os.stat(self.hocon_file).st_mtime_ns, entry["mtime_ns"])
+        self.assertEqual("music_nerd", entry["contents"]["agent"])
+
+    def test_substitutions_not_persisted(self):
+        """
+        Tests that files with substitutions are never kept on disk, as they can resolve
+        differently from run to run, and that any copy from before they had one is removed.
+        """
+        load_hocon(self.hocon_file)
+        self.assertEqual(1, len(self.get_cache_files()))
+
+        self.write('{ "agent": "hello_world", "home": ${?HOME} }')
+        load_hocon(self.hocon_file)
+        self.assertEqual([], self.get_cache_files())
+
+    def test_includes_not_persisted(self):
+        """
+        Tests that files with includes are never kept on disk, as an included file can change
+        without this one changing, and that any copy from before they had one is removed.
+        """
+        load_hocon(self.hocon_file)
+        self.assertEqual(1, len(self.get_cache_files()))
+
+        included_file: str = os.path.join(self.temp_dir.name, "included.hocon")
+        with open(included_file, "w", encoding="utf-8") as included:
+            included.write('{ "agent": "music_nerd" }')
+        self.write(f'{{\n    include "{included_file}"\n}}')
+        self.assertEqual("music_nerd", load_hocon(self.hocon_file)["agent"])
+        self.assertEqual([], self.get_cache_files())
+
+    def test_failed_write_leaves_nothing_behind(self):
+        """
+        Tests that a failure partway through writing a copy to disk does not leave a partial file behind.
+        """
+        with patch("tests.utils.hocon_cache.json.dump", side_effect=TypeError("not serializable")):
+            self.assertEqual("hello_world", load_hocon(self.hocon_file)["agent"])
+
+        self.assertEqual([], self.get_cache_files())
@@ -0,0 +1,141 @@
+# Copyright © 2025-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import os
+import tempfile
+from typing import Any
+from typing import Dict
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+from tests.utils.hocon_cache import HoconCacheSettings
+from tests.utils.hocon_pass_cache import HoconPassCache
+
+
+class FakeCache:
+    """
+    Stands in for the pytest Cache, keeping its values in memory.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.values: Dict[str, Any] = {}
+
+    def get(self, key: str, default: Any) -> Any:
+        """
+        :return: The value for the key, or the default if there is none
+        """
+        return self.values.get(key, default)
+
+    def set(self, key: str, value: Any):
+        """
+        Sets the value for the key
+        """
+        self.values[key] = value
+
+
+class TestHoconPassCache(TestCase):
+    """
+    Unit tests for the HoconPassCache class.
+    """
+
+    def setUp(self):
+        """
+        Set up a registry with an agent network that includes another file,
+        and a test case that uses the network.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.registry_dir: str = os.path.join(self.temp_dir.name, "registries")
+        os.makedirs(self.registry_dir)
+        self.manifest_file: str = self.write("registries/manifest.hocon", '{ "hello_world.hocon": true }')
+        self.included_file: str = self.write("registries/llm_config.hocon", '{ "model_name": "gpt-4o" }')
+        self.agent_file: str = self.write(
+            "registries/hello_world.hocon", f'include "{self.included_file}"\n{{ "tools": [] }}'
+        )
+        self.test_file: str = self.write("hello_world.hocon", '{ "agent": "hello_world", "interactions": [] }')
+
+        environ_patch = patch.dict(os.environ, {"AGENT_MANIFEST_FILE": self.manifest_file})
+        environ_patch.start()
+        self.addCleanup(environ_patch.stop)
+
+        # Keep these scratch files out of the hocon cache on disk
+        cache_dir_patch = patch.object(HoconCacheSettings, "cache_dir", None)
+        cache_dir_patch.start()
+        self.addCleanup(cache_dir_patch.stop)
+
+        self.pass_cache = HoconPassCache(FakeCache())
+
+    def write(self, file_name: str, contents: str) -> str:
+        """
+        :param file_name: The name of the file relative to the scratch directory
+        :param contents: The contents of the file
+        :return: The full path to the file
+        """
+        path: str = os.path.join(self.temp_dir.name, file_name)
+        with open(path, "w", encoding="utf-8") as hocon_file:
+            hocon_file.write(contents)
+        return path
+
+    def test_get_dependencies(self):
+        """
+        Tests that a test case depends on itself, the agent network it tests and what that includes.
+        """
+        dependencies: List[str] = self.pass_cache.get_dependencies(self.test_file)
+        self.assertEqual([self.test_file, self.agent_file, self.included_file], dependencies)
+
+    def test_get_dependencies_of_agent_file(self):
+        """
+        Tests that an agent given as a hocon file is used as is, rather than looked up in the registry.
+        """
+        other_agent_file: str = self.write("other_agent.hocon", '{ "tools": [] }')
+        test_file: str = self.write("other_test.hocon", f'{{ "agent": "{other_agent_file}" }}')
+
+        dependencies: List[str] = self.pass_cache.get_dependencies(test_file)
+        self.assertEqual([test_file, other_agent_file], dependencies)
+
+    def test_unchanged_after_pass(self):
+        """
+        Tests that a test case is only unchanged once it has passed.
+        """
+        self.assertFalse(self.pass_cache.is_unchanged_since_pass(self.test_file))
+        self.pass_cache.record_pass(self.test_file)
+        self.assertTrue(self.pass_cache.is_unchanged_since_pass(self.test_file))
+
+    def test_changed_dependencies(self):
+        """
+        Tests that changing any file a test case depends on means it has to run again.
+        """
+        for changed_file in [self.test_file, self.agent_file, self.included_file]:
+            self.pass_cache.record_pass(self.test_file)
+            with open(changed_file, "a", encoding="utf-8") as hocon_file:
+                hocon_file.write("\n# Changed\n")
+            self.assertFalse(self.pass_cache.is_unchanged_since_pass(self.test_file), changed_file)
+
+    def test_missing_dependency_appears(self):
+        """
+        Tests that a missing dependency showing up later means the test case has to run again.
+        """
+        os.remove(self.included_file)
+        self.pass_cache.record_pass(self.test_file)
+        self.assertTrue(self.pass_cache.is_unchanged_since_pass(self.test_file))
+
+        self.write("registries/llm_config.hocon", "{}")
+        self.assertFalse(self.pass_cache.is_unchanged_since_pass(self.test_file))